@@ -1,8 +1,11 @@
 """
 AI Animal Tracking System - Config Package
 ==========================================
+
+Ayarlar örneği `get_settings()` ile ilk çağrıda oluşturulur;
+`import config` Settings kurmaz. `config.settings` alt modüldür.
 """
 
-from config.settings import settings, get_settings, Settings
+from config.settings import get_settings, Settings
 
-__all__ = ["settings", "get_settings", "Settings"]
+__all__ = ["get_settings", "Settings"]
@@ -4,30 +4,30 @@ AI Animal Tracking System - Settings Configuration
 
 Merkezi konfigürasyon yönetimi için Pydantic Settings kullanılır.
 Environment variables, .env dosyası ve varsayılan değerler desteklenir.
+Tüm bölümler tek bir RootSettings üzerinden yüklenir; .env dosyası
+süreç başına yalnızca bir kez okunur.
 """
 
-import os
 from pathlib import Path
-from typing import List, Optional
-from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
+from functools import cached_property, lru_cache
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import BaseModel, Field, field_validator
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 
 # Proje kök dizini
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
-class AppSettings(BaseSettings):
+class AppSettings(BaseModel):
     """Uygulama genel ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = ""
     
     # Uygulama bilgileri
     app_name: str = Field(default="AI Animal Tracking System")
@@ -46,14 +46,10 @@ class AppSettings(BaseSettings):
         return v.lower()
 
 
-class ServerSettings(BaseSettings):
+class ServerSettings(BaseModel):
     """Sunucu ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="SERVER_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "SERVER_"
     
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
@@ -61,14 +57,10 @@ class ServerSettings(BaseSettings):
     reload: bool = Field(default=True)
 
 
-class DatabaseSettings(BaseSettings):
+class DatabaseSettings(BaseModel):
     """Veritabanı ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="DATABASE_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "DATABASE_"
     
     url: str = Field(default="sqlite:///./data/animal_tracking.db")
     pool_size: int = Field(default=10)
@@ -76,27 +68,19 @@ class DatabaseSettings(BaseSettings):
     echo: bool = Field(default=False)
 
 
-class RedisSettings(BaseSettings):
+class RedisSettings(BaseModel):
     """Redis ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="REDIS_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "REDIS_"
     
     url: str = Field(default="redis://localhost:6379/0")
     password: Optional[str] = Field(default=None)
 
 
-class StorageSettings(BaseSettings):
+class StorageSettings(BaseModel):
     """Depolama ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="STORAGE_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "STORAGE_"
     
     type: str = Field(default="local")
     path: str = Field(default="./data")
@@ -107,14 +91,10 @@ class StorageSettings(BaseSettings):
     max_video_size_mb: int = Field(default=500)
 
 
-class ModelSettings(BaseSettings):
+class ModelSettings(BaseModel):
     """AI Model ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="MODEL_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "MODEL_"
     
     device: str = Field(default="auto")
     detection: str = Field(default="yolov8n.pt")
@@ -130,14 +110,10 @@ class ModelSettings(BaseSettings):
         return v.lower()
 
 
-class CameraSettings(BaseSettings):
+class CameraSettings(BaseModel):
     """Kamera ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="CAMERA_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "CAMERA_"
     
     default_fps: int = Field(default=30)
     default_resolution: str = Field(default="1280x720")
@@ -145,14 +121,10 @@ class CameraSettings(BaseSettings):
     reconnect_interval: int = Field(default=5)
 
 
-class NotificationSettings(BaseSettings):
+class NotificationSettings(BaseModel):
     """Bildirim ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = ""
     
     # SMTP
     smtp_host: str = Field(default="smtp.gmail.com")
@@ -167,14 +139,10 @@ class NotificationSettings(BaseSettings):
     telegram_chat_id: Optional[str] = Field(default=None)
 
 
-class SecuritySettings(BaseSettings):
+class SecuritySettings(BaseModel):
     """Güvenlik ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = ""
     
     jwt_secret_key: str = Field(default="change-this-in-production")
     jwt_algorithm: str = Field(default="HS256")
@@ -187,19 +155,15 @@ class SecuritySettings(BaseSettings):
     rate_limit_requests: int = Field(default=100)
     rate_limit_period: int = Field(default=60)
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
 
 
-class BehaviorSettings(BaseSettings):
+class BehaviorSettings(BaseModel):
     """Davranış analizi ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="BEHAVIOR_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "BEHAVIOR_"
     
     analysis_interval: float = Field(default=1.0)
     history_window: int = Field(default=300)
@@ -208,14 +172,10 @@ class BehaviorSettings(BaseSettings):
     anomaly_threshold: float = Field(default=2.5)
 
 
-class HealthSettings(BaseSettings):
+class HealthSettings(BaseModel):
     """Sağlık izleme ayarları"""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="HEALTH_",
-        extra="ignore"
-    )
+    env_prefix: ClassVar[str] = "HEALTH_"
     
     check_interval: int = Field(default=3600)
     bcs_estimation_enabled: bool = Field(default=True)
@@ -223,48 +183,161 @@ class HealthSettings(BaseSettings):
     early_warning_enabled: bool = Field(default=True)
 
 
+class _SectionEnvSource(PydanticBaseSettingsSource):
+    """
+    Düz `SERVER_PORT` gibi env isimlerini iç içe bölümlere eşler.
+    
+    Ortam değişkenleri ve `.env` içeriği diğer kaynaklardan devralınır,
+    böylece dosya yalnızca bir kez okunur.
+    """
+    
+    def __init__(self, settings_cls: Type[BaseSettings], env_vars: Dict[str, Optional[str]]):
+        super().__init__(settings_cls)
+        self.env_vars = env_vars
+    
+    def get_field_value(self, field, field_name: str) -> Tuple[Any, str, bool]:
+        # Bölümler __call__ içinde toplu olarak çözülür
+        return None, field_name, False
+    
+    def __call__(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        for section, field in self.settings_cls.model_fields.items():
+            model = field.annotation
+            prefix = model.env_prefix.lower()
+            values = {
+                name: self.env_vars[f"{prefix}{name}"]
+                for name in model.model_fields
+                if self.env_vars.get(f"{prefix}{name}") is not None
+            }
+            if values:
+                data[section] = values
+        return data
+
+
+class RootSettings(BaseSettings):
+    """Tüm bölümleri tek bir env/.env okumasıyla yükleyen kök ayarlar"""
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+        extra="ignore"
+    )
+    
+    app: AppSettings = Field(default_factory=AppSettings)
+    server: ServerSettings = Field(default_factory=ServerSettings)
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+    storage: StorageSettings = Field(default_factory=StorageSettings)
+    model: ModelSettings = Field(default_factory=ModelSettings)
+    camera: CameraSettings = Field(default_factory=CameraSettings)
+    notification: NotificationSettings = Field(default_factory=NotificationSettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
+    behavior: BehaviorSettings = Field(default_factory=BehaviorSettings)
+    health: HealthSettings = Field(default_factory=HealthSettings)
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # Ortam değişkenleri .env değerlerini ezer
+        env_vars = {**dotenv_settings.env_vars, **env_settings.env_vars}
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            _SectionEnvSource(settings_cls, env_vars),
+            file_secret_settings,
+        )
+
+
 class Settings:
     """Tüm ayarları birleştiren ana sınıf"""
     
     def __init__(self):
-        self.app = AppSettings()
-        self.server = ServerSettings()
-        self.database = DatabaseSettings()
-        self.redis = RedisSettings()
-        self.storage = StorageSettings()
-        self.model = ModelSettings()
-        self.camera = CameraSettings()
-        self.notification = NotificationSettings()
-        self.security = SecuritySettings()
-        self.behavior = BehaviorSettings()
-        self.health = HealthSettings()
+        root = RootSettings()
+        self.app = root.app
+        self.server = root.server
+        self.database = root.database
+        self.redis = root.redis
+        self.storage = root.storage
+        self.model = root.model
+        self.camera = root.camera
+        self.notification = root.notification
+        self.security = root.security
+        self.behavior = root.behavior
+        self.health = root.health
         
-        # Dizin yolları
+        # Dizin yolları (veri dizinleri ilk erişimde oluşturulur)
         self.base_dir = BASE_DIR
         self.config_dir = BASE_DIR / "config"
-        self.data_dir = BASE_DIR / "data"
-        self.models_dir = BASE_DIR / "models"
-        self.logs_dir = BASE_DIR / "logs"
-        
-        # Dizinleri oluştur
-        self._create_directories()
+    
+    @staticmethod
+    def _ensure_dir(directory: Path) -> Path:
+        """Dizini gerekirse oluşturup döndürür"""
+        # exist_ok=True eşzamanlı ilk erişimlerde de güvenlidir
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+    
+    @cached_property
+    def data_dir(self) -> Path:
+        return self._ensure_dir(BASE_DIR / "data")
+    
+    @cached_property
+    def models_dir(self) -> Path:
+        return self._ensure_dir(BASE_DIR / "models")
+    
+    @cached_property
+    def logs_dir(self) -> Path:
+        return self._ensure_dir(BASE_DIR / "logs")
+    
+    @cached_property
+    def videos_dir(self) -> Path:
+        return self._ensure_dir(self.data_dir / "videos")
+    
+    @cached_property
+    def snapshots_dir(self) -> Path:
+        return self._ensure_dir(self.data_dir / "snapshots")
+    
+    @cached_property
+    def exports_dir(self) -> Path:
+        return self._ensure_dir(self.data_dir / "exports")
+    
+    @cached_property
+    def datasets_dir(self) -> Path:
+        return self._ensure_dir(self.data_dir / "datasets")
+    
+    @cached_property
+    def embeddings_dir(self) -> Path:
+        return self._ensure_dir(self.data_dir / "embeddings")
+    
+    @cached_property
+    def pretrained_models_dir(self) -> Path:
+        return self._ensure_dir(self.models_dir / "pretrained")
+    
+    @cached_property
+    def custom_models_dir(self) -> Path:
+        return self._ensure_dir(self.models_dir / "custom")
     
     def _create_directories(self):
-        """Gerekli dizinleri oluştur"""
-        directories = [
-            self.data_dir,
-            self.data_dir / "videos",
-            self.data_dir / "snapshots",
-            self.data_dir / "exports",
-            self.data_dir / "datasets",
-            self.data_dir / "embeddings",
-            self.models_dir / "pretrained",
-            self.models_dir / "custom",
-            self.logs_dir,
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        """Tüm veri dizinlerini hemen oluştur (kurulum betikleri için)"""
+        for name in (
+            "videos_dir",
+            "snapshots_dir",
+            "exports_dir",
+            "datasets_dir",
+            "embeddings_dir",
+            "pretrained_models_dir",
+            "custom_models_dir",
+            "logs_dir",
+        ):
+            getattr(self, name)
     
     @property
     def is_development(self) -> bool:
@@ -281,5 +354,8 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def __getattr__(name: str):
+    # `settings` ilk erişimde oluşturulur (PEP 562)
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,20 +13,41 @@ Kullanım:
     python demo.py --animals-only   # Sadece hayvanlar
 """
 
+from __future__ import annotations
+
 import argparse
+import queue
 import sys
+import threading
 import time
 import logging
 from pathlib import Path
-
-import cv2
-import numpy as np
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 # Project path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.detection import YOLODetector, Detection, DetectionResult
-from src.tracking import ObjectTracker, TrackingResult
+if TYPE_CHECKING:
+    import cv2
+    import numpy as np
+    
+    from src.detection import DetectionResult
+    from src.tracking import TrackingResult
+
+
+def _load_runtime():
+    """
+    Ağır bağımlılıkları (OpenCV, NumPy, detector) yükle.
+    
+    Argümanlar ayrıştırıldıktan sonra çağrılır; `--help` bunları yüklemez.
+    """
+    global cv2, np, YOLODetector, ObjectTracker, TrackingResult
+    
+    import cv2
+    import numpy as np
+    
+    from src.detection import YOLODetector
+    from src.tracking import ObjectTracker, TrackingResult
 
 
 # Logging
@@ -47,60 +68,241 @@ def draw_trajectory(
     if len(track.history) < 2:
         return frame
     
-    points = track.history[-max_points:]
+    points = np.asarray(track.history[-max_points:], dtype=np.int32)
+    n = len(points)
     
-    for i in range(1, len(points)):
-        alpha = i / len(points)  # Fade effect
-        thickness = max(1, int(3 * alpha))
-        pt1 = tuple(points[i-1])
-        pt2 = tuple(points[i])
-        cv2.line(frame, pt1, pt2, color, thickness)
+    # Fade effect: segment i kalınlığı max(1, int(3 * i / n))
+    thicknesses = np.maximum(1, 3 * np.arange(1, n) // n)
+    
+    # Aynı kalınlıktaki segmentler ardışık; her grup tek polyline
+    for thickness in np.unique(thicknesses):
+        idx = np.flatnonzero(thicknesses == thickness)
+        segment = points[idx[0]:idx[-1] + 2].reshape(-1, 1, 2)
+        cv2.polylines(frame, [segment], False, color, int(thickness))
     
     return frame
 
 
-def draw_info_panel(
-    frame: np.ndarray,
-    detection_result: DetectionResult,
-    tracking_result: TrackingResult,
-) -> np.ndarray:
-    """Bilgi paneli çiz"""
-    h, w = frame.shape[:2]
-    
-    # Yarı saydam arka plan
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (10, 10), (300, 130), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
-    
-    # Bilgiler
-    fps = 1000 / detection_result.inference_time if detection_result.inference_time > 0 else 0
-    
-    info_lines = [
-        f"FPS: {fps:.1f}",
-        f"Inference: {detection_result.inference_time:.1f} ms",
-        f"Detections: {detection_result.count}",
-        f"Animals: {detection_result.animal_count}",
-        f"Active Tracks: {tracking_result.count}",
-    ]
-    
-    y = 35
-    for line in info_lines:
-        cv2.putText(frame, line, (20, y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        y += 20
+class TextSprite:
+    """Statik metni bir kez maske olarak rasterleştirir, her karede kopyalar"""
     
-    return frame
+    def __init__(
+        self,
+        frame_shape: Tuple[int, ...],
+        texts: List[Tuple[str, Tuple[int, int]]],
+        font_scale: float,
+        thickness: int,
+    ):
+        mask = np.zeros(frame_shape[:2], dtype=np.uint8)
+        for text, org in texts:
+            cv2.putText(mask, text, org, cv2.FONT_HERSHEY_SIMPLEX,
+                       font_scale, 255, thickness)
+        
+        # Sadece metni içeren bölge saklanır
+        x, y, w, h = cv2.boundingRect(mask)
+        self.region = (slice(y, y + h), slice(x, x + w))
+        self.mask = mask[self.region].astype(bool)
+    
+    def blit(self, frame: np.ndarray, color: Tuple[int, int, int]) -> None:
+        frame[self.region][self.mask] = color
 
 
-def draw_help(frame: np.ndarray) -> np.ndarray:
-    """Yardım metni çiz"""
-    h, w = frame.shape[:2]
+class InfoPanelRenderer:
+    """
+    Bilgi paneli ve yardım metni çizici.
     
-    help_text = "Q:Quit | A:Animals | T:Trajectory | R:Reset"
-    cv2.putText(frame, help_text, (10, h - 10),
-               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    Panel arka planı için tam kare kopyası yerine yalnızca panel
+    bölgesi yerinde ölçeklenerek karartılır. Yardım metni kare boyutu
+    başına bir kez rasterleştirilir. Bilgi satırları etiketle birlikte
+    tek putText ile çizilir: putText kalemi alt piksel hassasiyetle
+    ilerlediğinden, ayrı çizilen değer tam sayı konumda baseline ile
+    aynı pikselleri vermez.
+    """
     
-    return frame
+    # cv2.rectangle((10, 10), (300, 130)) uç noktaları dahil
+    PANEL_Y = slice(10, 131)
+    PANEL_X = slice(10, 301)
+    
+    LABELS = ("FPS: ", "Inference: ", "Detections: ", "Animals: ", "Active Tracks: ")
+    TEXT_COLOR = (0, 255, 0)
+    FONT_SCALE = 0.6
+    THICKNESS = 2
+    
+    HELP_TEXT = "Q:Quit | A:Animals | T:Trajectory | R:Reset"
+    HELP_COLOR = (255, 255, 255)
+    
+    def __init__(self):
+        self._frame_shape: Optional[Tuple[int, ...]] = None
+        self._help_sprite: Optional[TextSprite] = None
+    
+    def _ensure_sprites(self, frame: np.ndarray) -> None:
+        """Kare boyutu değiştiğinde statik sprite'ları yeniden oluştur"""
+        if frame.shape == self._frame_shape:
+            return
+        
+        h = frame.shape[0]
+        self._frame_shape = frame.shape
+        self._help_sprite = TextSprite(
+            frame.shape, [(self.HELP_TEXT, (10, h - 10))], 0.5, 1
+        )
+    
+    def _dim_background(self, frame: np.ndarray) -> None:
+        """Panel bölgesini yerinde %60 karart"""
+        # Siyah dikdörtgenle 0.6/0.4 karıştırmaya eşdeğer: roi * 0.4
+        roi = frame[self.PANEL_Y, self.PANEL_X]
+        cv2.multiply(roi, (0.4, 0.4, 0.4, 0.4), dst=roi)
+    
+    def draw(
+        self,
+        frame: np.ndarray,
+        detection_result: DetectionResult,
+        tracking_result: TrackingResult,
+    ) -> np.ndarray:
+        """Bilgi paneli çiz"""
+        # Yarı saydam arka plan
+        self._dim_background(frame)
+        
+        # Bilgiler
+        fps = 1000 / detection_result.inference_time if detection_result.inference_time > 0 else 0
+        
+        values = [
+            f"{fps:.1f}",
+            f"{detection_result.inference_time:.1f} ms",
+            f"{detection_result.count}",
+            f"{detection_result.animal_count}",
+            f"{tracking_result.count}",
+        ]
+        
+        y = 35
+        for label, value in zip(self.LABELS, values):
+            cv2.putText(frame, label + value, (20, y), cv2.FONT_HERSHEY_SIMPLEX,
+                       self.FONT_SCALE, self.TEXT_COLOR, self.THICKNESS)
+            y += 20
+        
+        return frame
+    
+    def draw_help(self, frame: np.ndarray) -> np.ndarray:
+        """Yardım metni çiz"""
+        self._ensure_sprites(frame)
+        self._help_sprite.blit(frame, self.HELP_COLOR)
+        return frame
+
+
+class FrameReader:
+    """
+    Kare okuyucu thread.
+    
+    cap.read() I/O beklemesini inference ile örtüştürmek için kareleri
+    arka planda küçük bir kuyruğa okur. Canlı kaynaklarda kuyruk doluysa
+    en eski kare atılır; video dosyalarında okuyucu bekler (backpressure).
+    """
+    
+    def __init__(self, cap: cv2.VideoCapture, live: bool, maxsize: int = 2):
+        self.cap = cap
+        self.live = live
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "FrameReader":
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+        return self
+    
+    def _read_loop(self):
+        while self._running:
+            ret, frame = self.cap.read()
+            
+            if self.live:
+                if not ret:
+                    continue
+                # Drop-oldest: her zaman en taze kare işlenir
+                try:
+                    self._queue.put_nowait((ret, frame))
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._queue.put_nowait((ret, frame))
+            else:
+                self._put_blocking((ret, frame))
+                if not ret:
+                    # Video dosyası bitti
+                    break
+    
+    def _put_blocking(self, item) -> None:
+        while self._running:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def read(self, timeout: float = 1.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Sıradaki kareyi döndür.
+        
+        Canlı kaynaklarda zaman aşımında (False, None) döner. Video
+        dosyalarında (False, None) yalnızca dosya sonunu bildirir: okuyucu
+        sonlanma işaretini koyana ya da thread bitene kadar beklenir.
+        """
+        if self.live:
+            try:
+                return self._queue.get(timeout=timeout)
+            except queue.Empty:
+                return False, None
+        
+        while self._thread is not None and self._thread.is_alive():
+            try:
+                return self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        
+        # Thread bitti: kuyrukta kalan kare ya da sonlanma işareti
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return False, None
+    
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+
+class AsyncVideoWriter:
+    """
+    Arka plan thread'inde kare yazan VideoWriter sarmalayıcısı.
+    
+    Encode süresi ana döngüden çıkarılır. Kuyruk sınırlıdır; dolarsa
+    write() bekler, kayıttan kare düşürülmez. Yazılan kareler her
+    döngüde yeniden oluşturulduğundan kopyalanmaz.
+    """
+    
+    def __init__(self, writer: cv2.VideoWriter, maxsize: int = 16):
+        self.writer = writer
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+    
+    def _write_loop(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            self.writer.write(frame)
+    
+    def write(self, frame: np.ndarray):
+        self._queue.put(frame)
+    
+    def release(self):
+        """Kuyruktaki kareleri yazıp writer'ı kapat"""
+        self._queue.put(None)
+        self._thread.join()
+        self.writer.release()
 
 
 def main():
@@ -120,6 +322,8 @@ def main():
     
     args = parser.parse_args()
     
+    _load_runtime()
+    
     # Source
     source = args.source
     if source.isdigit():
@@ -146,6 +350,14 @@ def main():
         logger.error(f"Failed to open video source: {source}")
         return 1
     
+    if isinstance(source, int):
+        # Webcam: MJPG skips the per-frame YUYV->BGR conversion,
+        # a 1-frame buffer keeps reads on the freshest frame
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
     # Video properties
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -157,23 +369,32 @@ def main():
     writer = None
     if args.save:
         fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        writer = cv2.VideoWriter(args.save, fourcc, fps, (frame_width, frame_height))
+        writer = AsyncVideoWriter(
+            cv2.VideoWriter(args.save, fourcc, fps, (frame_width, frame_height))
+        )
         logger.info(f"Saving output to: {args.save}")
     
+    # Overlay
+    info_panel = InfoPanelRenderer()
+    
     # State
     animals_only = args.animals_only
     show_trajectory = True
     
     logger.info("Press 'Q' to quit, 'A' to toggle animals only, 'T' for trajectory, 'R' to reset")
     
+    # Capture thread
+    is_file = isinstance(source, str) and not source.startswith("rtsp")
+    reader = FrameReader(cap, live=not is_file).start()
+    
     try:
         frame_count = 0
         start_time = time.time()
         
         while True:
-            ret, frame = cap.read()
+            ret, frame = reader.read()
             if not ret:
-                if isinstance(source, str) and not source.startswith("rtsp"):
+                if is_file:
                     # Video file ended
                     break
                 continue
@@ -206,8 +427,8 @@ def main():
                     output = draw_trajectory(output, track)
             
             # Info panel
-            output = draw_info_panel(output, detection_result, tracking_result)
-            output = draw_help(output)
+            output = info_panel.draw(output, detection_result, tracking_result)
+            output = info_panel.draw_help(output)
             
             # Display
             cv2.imshow("AI Animal Tracking Demo", output)
@@ -239,6 +460,7 @@ def main():
     
     finally:
         # Cleanup
+        reader.stop()
         cap.release()
         if writer:
             writer.release()
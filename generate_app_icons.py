@@ -21,9 +21,7 @@ IOS_ICON_SIZES = {
     "Icon-1024.png": 1024,
 }
 
-def create_icon_svg():
-    """Generate SVG content for Teknova logo"""
-    svg = '''<?xml version="1.0" encoding="UTF-8"?>
+ICON_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="1024" height="1024" viewBox="0 0 1024 1024" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
@@ -68,10 +66,35 @@ def create_icon_svg():
     TEKNOVA
   </text>
 </svg>'''
-    return svg
+
+def create_icon_svg():
+    """Generate SVG content for Teknova logo"""
+    return ICON_SVG
+
+def resize_icons(source_png, output_path):
+    """Decode the 1024px source once and resize every icon size in-process"""
+    try:
+        from PIL import Image
+    except ImportError:
+        print("❌ PIL not available, cannot resize icons")
+        return
+    
+    src = Image.open(source_png).convert("RGBA")
+    # Small sizes are downsampled from a 512px intermediate to keep the LANCZOS footprint small
+    mid = src.resize((512, 512), Image.LANCZOS)
+    
+    for filename, size in IOS_ICON_SIZES.items():
+        base = mid if size <= 256 else src
+        try:
+            base.resize((size, size), Image.LANCZOS).save(
+                output_path / filename, optimize=False, compress_level=3
+            )
+            print(f"✅ Created: {filename} ({size}x{size})")
+        except Exception as e:
+            print(f"❌ Failed to create {filename}: {e}")
 
 def generate_png_icons(output_dir):
-    """Generate PNG icons using sips (macOS built-in)"""
+    """Generate PNG icons from the SVG source"""
     
     # Create output directory
     output_path = Path(output_dir)
@@ -79,8 +102,7 @@ def generate_png_icons(output_dir):
     
     # Save SVG
     svg_path = output_path / "icon_source.svg"
-    with open(svg_path, 'w') as f:
-        f.write(create_icon_svg())
+    svg_path.write_text(ICON_SVG, encoding="utf-8")
     
     print(f"✅ SVG source saved to: {svg_path}")
     
@@ -115,7 +137,7 @@ def generate_png_icons(output_dir):
         except Exception as e:
             print(f"⚠️ ImageMagick not available: {e}")
     
-    # Method 3: Create a simple colored icon using sips
+    # Method 3: Create a simple colored icon using PIL
     if not success:
         print("📝 Creating fallback icon using CoreGraphics...")
         create_fallback_icon(output_path)
@@ -123,26 +145,14 @@ def generate_png_icons(output_dir):
         temp_png = output_path / "temp_1024.png"
     
     if success and temp_png.exists():
-        # Resize to all needed sizes using sips
-        for filename, size in IOS_ICON_SIZES.items():
-            output_file = output_path / filename
-            try:
-                subprocess.run([
-                    'sips', '-z', str(size), str(size),
-                    str(temp_png), '--out', str(output_file)
-                ], check=True, capture_output=True, timeout=30)
-                print(f"✅ Created: {filename} ({size}x{size})")
-            except Exception as e:
-                print(f"❌ Failed to create {filename}: {e}")
+        resize_icons(temp_png, output_path)
         
         # Clean up temp file
         if temp_png.exists():
             temp_png.unlink()
     
     # Create Contents.json
-    contents_json = create_contents_json()
-    with open(output_path / "Contents.json", 'w') as f:
-        f.write(contents_json)
+    (output_path / "Contents.json").write_text(CONTENTS_JSON, encoding="utf-8")
     print(f"✅ Contents.json updated")
     
     return output_path
@@ -150,19 +160,20 @@ def generate_png_icons(output_dir):
 def create_fallback_icon(output_path):
     """Create a simple gradient icon using Python PIL"""
     try:
+        import numpy as np
         from PIL import Image, ImageDraw, ImageFont
         
         size = 1024
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
         
         # Draw rounded rectangle background with gradient effect
-        for i in range(size):
-            # Gradient from green (#127A50) to blue (#3B6DF2)
-            r = int(18 + (59 - 18) * i / size)
-            g = int(122 + (109 - 122) * i / size)
-            b = int(80 + (242 - 80) * i / size)
-            draw.line([(0, i), (size, i)], fill=(r, g, b, 255))
+        # Gradient from green (#127A50) to blue (#3B6DF2), one color per row
+        rows = np.arange(size, dtype=np.float64)[:, None]
+        start = np.array([18, 122, 80, 255], dtype=np.float64)
+        end = np.array([59, 109, 242, 255], dtype=np.float64)
+        row_colors = (start + (end - start) * rows / size).astype(np.uint8)
+        gradient = np.broadcast_to(row_colors[:, None, :], (size, size, 4))
+        img = Image.fromarray(np.ascontiguousarray(gradient), 'RGBA')
+        draw = ImageDraw.Draw(img)
         
         # Add rounded corners
         corner_radius = 230
@@ -269,9 +280,7 @@ def create_minimal_icon(output_path):
         f.write(png_data)
     print("✅ Minimal icon created")
 
-def create_contents_json():
-    """Create Contents.json for Xcode asset catalog"""
-    return '''{
+CONTENTS_JSON = '''{
   "images" : [
     {
       "filename" : "Icon-20@2x.png",
@@ -334,6 +343,10 @@ def create_contents_json():
   }
 }'''
 
+def create_contents_json():
+    """Create Contents.json for Xcode asset catalog"""
+    return CONTENTS_JSON
+
 if __name__ == "__main__":
     # Output to the iOS project's Assets folder
     script_dir = Path(__file__).parent
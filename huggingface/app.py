@@ -7,18 +7,20 @@ Deployed on Hugging Face Spaces with GPU support.
 """
 
 import os
-import io
 import time
+import asyncio
+import hashlib
 import logging
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 import numpy as np
 import cv2
-from PIL import Image
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
 # Configure logging
@@ -36,8 +38,28 @@ class Config:
     SIMILARITY_THRESHOLD = 0.92
     MAX_GALLERY_SIZE = 500
     
+    # TensorRT FP16 engine (exported once next to the .pt on GPU hosts)
+    USE_TENSORRT = os.getenv("USE_TENSORRT", "1") == "1"
+    IMAGE_SIZE = 640
+    WARMUP_RUNS = 3
+    
+    # Micro-batching of concurrent /process-frame requests into one forward pass
+    MAX_BATCH = 8
+    BATCH_TIMEOUT = 0.002  # seconds to wait for more frames after the first
+    
+    # Results of recently uploaded frames, keyed by content hash (client retries)
+    FRAME_CACHE_SIZE = 16
+    
+    # Feature smoothing (EMA) and per-animal observation history for retuning
+    FEATURE_EMA_ALPHA = 0.02
+    FEATURE_HISTORY_SIZE = 128
+    
     # COCO Animal Class IDs
-    ANIMAL_CLASS_IDS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 23}
+    ANIMAL_CLASS_IDS = frozenset(range(14, 24))
+    
+    # Boolean mask over the 80 COCO classes for vectorized filtering
+    ANIMAL_CLASS_MASK = np.zeros(80, dtype=bool)
+    ANIMAL_CLASS_MASK[14:24] = True
     ANIMAL_NAMES = {
         14: 'bird', 15: 'cat', 16: 'dog', 17: 'horse',
         18: 'sheep', 19: 'cow', 20: 'elephant', 21: 'bear',
@@ -51,6 +73,11 @@ class Config:
         'bird': 'KUS', 'elephant': 'FIL', 'bear': 'AYI',
         'zebra': 'ZEBRA', 'giraffe': 'ZURAFA'
     }
+    
+    # Index-based lookups: class_id -> name/prefix via [class_id - ANIMAL_CLASS_MIN]
+    ANIMAL_CLASS_MIN = 14
+    ANIMAL_NAME_BY_CLASS = tuple(map(ANIMAL_NAMES.get, range(14, 24)))
+    PREFIX_BY_CLASS = tuple(map(TURKISH_PREFIXES.get, ANIMAL_NAME_BY_CLASS))
 
 # ===========================================
 # Models
@@ -100,60 +127,130 @@ class GalleryResponse(BaseModel):
 class FeatureExtractor:
     """Extract visual features for animal re-identification"""
     
-    def __init__(self, feature_size=(128, 256), color_bins=32):
+    def __init__(
+        self,
+        feature_size=(128, 256),
+        color_bins=32,
+        use_opencl: Optional[bool] = None,
+        workers: Optional[int] = None
+    ):
         self.feature_size = feature_size
         self.color_bins = color_bins
+        
+        # Run the color conversions and Canny on OpenCL (cv2.UMat) when available
+        if use_opencl is None:
+            use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        self.use_opencl = use_opencl
+        
+        # CPU path: crops are split across threads (OpenCV releases the GIL)
+        if workers is None:
+            workers = min(4, os.cpu_count() or 1)
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") if workers > 1 else None
+        
+        # Fixed (start, end) offsets of each histogram in the combined vector:
+        # H, S, V, top/middle/bottom hue, edges
+        sizes = [color_bins, color_bins, color_bins // 2] + [color_bins] * 3 + [16]
+        ends = np.cumsum(sizes).tolist()
+        self._slots = list(zip([0] + ends[:-1], ends))
+        self.feature_dim = ends[-1]
     
-    def extract(self, image: np.ndarray, bbox: tuple) -> Optional[np.ndarray]:
-        """Extract features from bounding box region"""
-        x1, y1, x2, y2 = [int(v) for v in bbox]
-        h, w = image.shape[:2]
-        x1, y1 = max(0, x1), max(0, y1)
-        x2, y2 = min(w, x2), min(h, y2)
+    def extract(self, image: np.ndarray, bbox: tuple) -> np.ndarray:
+        """Extract features from a pre-clipped, non-empty bounding box region"""
+        return self.extract_batch(image, [bbox])[0]
+    
+    def extract_batch(self, image: np.ndarray, bboxes: List[tuple]) -> List[np.ndarray]:
+        """
+        Extract features for all detections of a frame at once.
         
-        if x2 <= x1 or y2 <= y1:
-            return None
+        Bboxes must already be clipped to the image and non-empty (see
+        AnimalDetector.process_frame). Crops are resized into one
+        (N, H, W, 3) buffer so the color conversions run once for the
+        whole batch. On the CPU path the crops are split into one chunk
+        per worker thread. Returns one feature vector per bbox.
+        """
+        if not bboxes:
+            return []
         
-        crop = image[y1:y2, x1:x2]
-        if crop.size == 0:
-            return None
+        crops = [image[y1:y2, x1:x2] for x1, y1, x2, y2 in bboxes]
+        out = np.empty((len(crops), self.feature_dim), dtype=np.float32)
         
-        try:
-            crop = cv2.resize(crop, self.feature_size)
-        except:
-            return None
+        if self.pool is None or self.use_opencl or len(crops) < 2:
+            self._extract_into(crops, out)
+        else:
+            bounds = np.linspace(0, len(crops), min(self.workers, len(crops)) + 1).astype(int).tolist()
+            list(self.pool.map(
+                lambda b: self._extract_into(crops[b[0]:b[1]], out[b[0]:b[1]]),
+                zip(bounds[:-1], bounds[1:])
+            ))
         
-        features = []
+        return list(out)
+    
+    def _extract_into(self, crops: List[np.ndarray], out: np.ndarray):
+        """Resize, convert and describe a list of crops into the rows of out"""
+        fw, fh = self.feature_size
+        batch = np.empty((len(crops), fh, fw, 3), dtype=np.uint8)
+        for crop, dst in zip(crops, batch):
+            cv2.resize(crop, self.feature_size, dst=dst)
+        
+        # Pixel-wise conversions over the stacked crops in a single call each.
+        # Canny runs per crop so edges never join across stacked crops.
+        tall = batch.reshape(-1, fw, 3)
+        if self.use_opencl:
+            # One upload; only the HSV and edge maps come back to the host
+            u_tall = cv2.UMat(tall)
+            hsv_batch = cv2.cvtColor(u_tall, cv2.COLOR_BGR2HSV).get().reshape(batch.shape)
+            u_gray = cv2.cvtColor(u_tall, cv2.COLOR_BGR2GRAY)
+            edge_batch = [
+                cv2.Canny(cv2.UMat(u_gray, (i * fh, (i + 1) * fh), (0, fw)), 50, 150).get()
+                for i in range(len(crops))
+            ]
+        else:
+            hsv_batch = cv2.cvtColor(tall, cv2.COLOR_BGR2HSV).reshape(batch.shape)
+            gray_batch = cv2.cvtColor(tall, cv2.COLOR_BGR2GRAY).reshape(batch.shape[:3])
+            edge_batch = [cv2.Canny(gray, 50, 150) for gray in gray_batch]
+        
+        # One output row per crop, filled in place
+        for hsv, edges, row in zip(hsv_batch, edge_batch, out):
+            self._describe(hsv, edges, row)
+    
+    def _describe(self, hsv: np.ndarray, edges: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Write the feature vector of one resized crop into out (feature_dim floats)"""
+        slots = self._slots
         
         # HSV histogram
-        hsv = cv2.cvtColor(crop, cv2.COLOR_BGR2HSV)
         for i, bins in enumerate([self.color_bins, self.color_bins, self.color_bins//2]):
             hist = cv2.calcHist([hsv], [i], None, [bins], [0, 256 if i > 0 else 180])
             cv2.normalize(hist, hist)
-            features.append(hist.flatten())
+            start, end = slots[i]
+            out[start:end] = hist.ravel()
         
-        # Regional histograms (top, middle, bottom)
-        h_crop = crop.shape[0]
-        for region in [crop[:h_crop//3], crop[h_crop//3:2*h_crop//3], crop[2*h_crop//3:]]:
-            hsv_region = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
-            hist = cv2.calcHist([hsv_region], [0], None, [self.color_bins], [0, 180])
+        # Regional histograms (top, middle, bottom), sliced from the HSV crop
+        h_crop = hsv.shape[0]
+        regions = [hsv[:h_crop//3], hsv[h_crop//3:2*h_crop//3], hsv[2*h_crop//3:]]
+        for (start, end), region in zip(slots[3:6], regions):
+            hist = cv2.calcHist([region], [0], None, [self.color_bins], [0, 180])
             cv2.normalize(hist, hist)
-            features.append(hist.flatten())
-        
-        # Edge features
-        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        edge_hist = cv2.calcHist([edges], [0], None, [16], [0, 256])
-        cv2.normalize(edge_hist, edge_hist)
-        features.append(edge_hist.flatten())
-        
-        # Combine and normalize
-        combined = np.concatenate(features)
-        norm = np.linalg.norm(combined)
+            out[start:end] = hist.ravel()
+        
+        # Edge features: Canny output is binary (0/255), so the 16-bin
+        # histogram only has mass in the first and last bins. Dividing by a
+        # float32 norm instead of cv2.normalize differs by a float32 ulp or
+        # two (< 1e-7) from calcHist + normalize, not bit for bit.
+        edge_count = cv2.countNonZero(edges)
+        start, end = slots[6]
+        edge_hist = out[start:end]
+        edge_hist[:] = 0
+        edge_hist[0] = edges.size - edge_count
+        edge_hist[-1] = edge_count
+        edge_hist /= np.linalg.norm(edge_hist)
+        
+        # Normalize the combined vector in place
+        norm = np.linalg.norm(out)
         if norm > 0:
-            combined = combined / norm
+            out /= norm
         
-        return combined.astype(np.float32)
+        return out
 
 # ===========================================
 # Animal Gallery
@@ -163,32 +260,103 @@ class AnimalGallery:
     """In-memory gallery for animal records"""
     
     def __init__(self):
-        self.records: Dict[str, Dict] = {}
-        self.features: Dict[str, np.ndarray] = {}
+        # Structure of arrays: per-animal scalars live in parallel arrays
+        # indexed by slot (capacity grows by doubling)
+        self._ids: List[str] = []
+        self._classes: List[str] = []
+        self._id_to_slot: Dict[str, int] = {}
+        self._allocate(0)
         self.id_counters: Dict[str, int] = {}
+        # Per class: row -> animal_id, matching the rows of class_matrix
         self.class_index: Dict[str, List[str]] = {}
+        # Per class: L2-normalized features stacked as rows (capacity grows by doubling).
+        # Rows are the EMA state of each animal's features.
+        self.class_matrix: Dict[str, np.ndarray] = {}
+        self.row_index: Dict[str, int] = {}
+        # Recent raw observations per animal, oldest first (seed = registration)
+        self.history: Dict[str, deque] = {}
+        self.alpha = Config.FEATURE_EMA_ALPHA
+        # Per prefix: bound str.format producing "<PREFIX>_<0000>"
+        self._id_formats: Dict[str, Any] = {
+            prefix: f"{prefix}_{{:04d}}".format
+            for prefix in Config.TURKISH_PREFIXES.values()
+        }
     
-    def generate_id(self, class_name: str) -> str:
-        prefix = Config.TURKISH_PREFIXES.get(class_name.lower(), class_name.upper()[:4])
-        self.id_counters[prefix] = self.id_counters.get(prefix, 0) + 1
-        return f"{prefix}_{self.id_counters[prefix]:04d}"
-    
-    def register(self, features: np.ndarray, class_name: str, confidence: float) -> str:
-        animal_id = self.generate_id(class_name)
-        
-        self.records[animal_id] = {
-            "animal_id": animal_id,
-            "class_name": class_name,
-            "first_seen": time.time(),
-            "last_seen": time.time(),
-            "total_detections": 1,
-            "best_confidence": confidence
+    def _allocate(self, capacity: int):
+        """(Re)allocate the per-slot arrays, keeping the occupied slots"""
+        n = len(self._ids)
+        arrays = {
+            "_first_seen": np.float64,
+            "_last_seen": np.float64,
+            "_total_detections": np.int32,
+            "_best_conf": np.float32,
         }
-        self.features[animal_id] = features.copy()
+        for name, dtype in arrays.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if n:
+                grown[:n] = getattr(self, name)[:n]
+            setattr(self, name, grown)
+    
+    def _set_row(self, animal_id: str, class_name: str, features: np.ndarray):
+        """Store the normalized features of an animal in its class matrix row"""
+        row = self.row_index[animal_id]
+        matrix = self.class_matrix.get(class_name)
+        
+        if matrix is None or row >= matrix.shape[0]:
+            capacity = max(16, 2 * row)
+            grown = np.empty((capacity, features.shape[0]), dtype=np.float32)
+            if matrix is not None:
+                grown[:row] = matrix[:row]
+            self.class_matrix[class_name] = matrix = grown
+        
+        matrix[row] = features / (np.linalg.norm(features) + 1e-8)
+    
+    def get_features(self, animal_id: str) -> Optional[np.ndarray]:
+        """Current (normalized) feature vector of an animal"""
+        slot = self._id_to_slot.get(animal_id)
+        if slot is None:
+            return None
+        class_name = self._classes[slot]
+        return self.class_matrix[class_name][self.row_index[animal_id]].copy()
+    
+    def generate_id(self, class_name: str, prefix: Optional[str] = None) -> str:
+        if prefix is None:
+            prefix = Config.TURKISH_PREFIXES.get(class_name.lower(), class_name.upper()[:4])
+        fmt = self._id_formats.get(prefix)
+        if fmt is None:
+            fmt = self._id_formats[prefix] = f"{prefix}_{{:04d}}".format
+        n = self.id_counters[prefix] = self.id_counters.get(prefix, 0) + 1
+        return fmt(n)
+    
+    def register(
+        self,
+        features: np.ndarray,
+        class_name: str,
+        confidence: float,
+        prefix: Optional[str] = None,
+        now: Optional[float] = None
+    ) -> str:
+        animal_id = self.generate_id(class_name, prefix)
+        
+        slot = len(self._ids)
+        if slot >= self._first_seen.shape[0]:
+            self._allocate(max(16, 2 * slot))
+        if now is None:
+            now = time.time()
+        self._first_seen[slot] = now
+        self._last_seen[slot] = now
+        self._total_detections[slot] = 1
+        self._best_conf[slot] = confidence
+        self._ids.append(animal_id)
+        self._classes.append(class_name)
+        self._id_to_slot[animal_id] = slot
         
         if class_name not in self.class_index:
             self.class_index[class_name] = []
+        self.row_index[animal_id] = len(self.class_index[class_name])
         self.class_index[class_name].append(animal_id)
+        self._set_row(animal_id, class_name, features)
+        self.history[animal_id] = deque([features.copy()], maxlen=Config.FEATURE_HISTORY_SIZE)
         
         logger.info(f"🆕 New animal registered: {animal_id}")
         return animal_id
@@ -202,55 +370,130 @@ class AnimalGallery:
         if not candidates:
             return []
         
-        results = []
+        # Cosine similarity against all candidates in one matrix-vector product
         query_norm = query_features / (np.linalg.norm(query_features) + 1e-8)
+        sims = self.class_matrix[class_name][:len(candidates)] @ query_norm
         
-        for animal_id in candidates:
-            if animal_id not in self.features:
-                continue
-            feat = self.features[animal_id]
-            feat_norm = feat / (np.linalg.norm(feat) + 1e-8)
-            similarity = float(np.dot(query_norm, feat_norm))
-            results.append((animal_id, similarity))
+        # Select the top k in O(N), then order only those k
+        k = min(top_k, sims.size)
+        order = np.argpartition(-sims, k - 1)[:k]
+        order = order[np.argsort(-sims[order], kind="stable")]
+        return [(candidates[i], float(sims[i])) for i in order]
+    
+    def search_full(self, query_features: np.ndarray, class_name: str) -> tuple:
+        """Cosine similarity against every animal of the class, with row-aligned ids"""
+        candidates = self.class_index.get(class_name)
+        if not candidates:
+            return np.empty(0, dtype=np.float32), []
         
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        query_norm = query_features / (np.linalg.norm(query_features) + 1e-8)
+        return self.class_matrix[class_name][:len(candidates)] @ query_norm, candidates
+    
+    @staticmethod
+    def _ema_step(row: np.ndarray, features: np.ndarray, alpha: float):
+        """Blend one observation into a normalized EMA row and renormalize it in place"""
+        cv2.addWeighted(row, 1 - alpha, features, alpha, 0, dst=row)
+        row *= 1.0 / (np.linalg.norm(row) + 1e-8)
     
-    def update(self, animal_id: str, features: np.ndarray, confidence: float):
+    def update(
+        self,
+        animal_id: str,
+        features: np.ndarray,
+        confidence: float,
+        now: Optional[float] = None
+    ):
         """Update existing animal record"""
-        if animal_id not in self.records:
+        slot = self._id_to_slot.get(animal_id)
+        if slot is None:
             return
         
-        # Exponential moving average for features
-        alpha = 0.02
-        self.features[animal_id] = (1 - alpha) * self.features[animal_id] + alpha * features
+        # Exponential moving average for features, blended and renormalized
+        # in place on the class matrix row (no temporaries)
+        self.history[animal_id].append(features.copy())
+        class_name = self._classes[slot]
+        self._ema_step(self.class_matrix[class_name][self.row_index[animal_id]], features, self.alpha)
+        
+        self._last_seen[slot] = time.time() if now is None else now
+        self._total_detections[slot] += 1
+        if confidence > self._best_conf[slot]:
+            self._best_conf[slot] = confidence
+    
+    def recompute_ema(self, animal_id: str, alpha: float) -> Optional[np.ndarray]:
+        """
+        Rebuild an animal's smoothed features from its buffered history.
         
-        self.records[animal_id]["last_seen"] = time.time()
-        self.records[animal_id]["total_detections"] += 1
-        if confidence > self.records[animal_id]["best_confidence"]:
-            self.records[animal_id]["best_confidence"] = confidence
+        Replays the recurrence update() applies (blend, then renormalize)
+        from the oldest buffered observation, so with the current alpha and
+        an unfilled history the result matches the live row. Once more than
+        FEATURE_HISTORY_SIZE observations were seen, the oldest kept one
+        stands in for the registration seed. The replay is bounded by the
+        history: at most FEATURE_HISTORY_SIZE (128) steps of one 192-float
+        vector per animal, and 128 * 192 * 4 B = 96 KiB of history each.
+        """
+        history = self.history.get(animal_id)
+        if not history:
+            return None
+        
+        observations = iter(history)
+        seed = next(observations)
+        smoothed = (seed / (np.linalg.norm(seed) + 1e-8)).astype(np.float32)
+        for features in observations:
+            self._ema_step(smoothed, features, alpha)
+        return smoothed
+    
+    def retune(self, alpha: float) -> int:
+        """Switch the EMA factor and rebuild every animal's features with it"""
+        self.alpha = alpha
+        for animal_id, class_name in zip(self._ids, self._classes):
+            self.class_matrix[class_name][self.row_index[animal_id]] = self.recompute_ema(animal_id, alpha)
+        logger.info(f"🎛️ Gallery retuned with alpha={alpha}")
+        return len(self._ids)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Gallery contents as plain JSON-ready dicts (GalleryResponse layout)"""
+        n = len(self._ids)
+        columns = zip(
+            self._ids,
+            self._classes,
+            self._first_seen[:n].tolist(),
+            self._last_seen[:n].tolist(),
+            self._total_detections[:n].tolist(),
+            self._best_conf[:n].tolist()
+        )
+        animals = [
+            {
+                "animal_id": animal_id,
+                "class_name": class_name,
+                "first_seen": first_seen,
+                "last_seen": last_seen,
+                "total_detections": total,
+                "best_confidence": best
+            }
+            for animal_id, class_name, first_seen, last_seen, total, best in columns
+        ]
+        by_class = {cls: len(ids) for cls, ids in self.class_index.items()}
+        return {"total": n, "animals": animals, "by_class": by_class}
     
     def get_all(self) -> GalleryResponse:
         """Get all animals in gallery"""
-        animals = [GalleryAnimal(**r) for r in self.records.values()]
-        by_class = {cls: len(ids) for cls, ids in self.class_index.items()}
-        return GalleryResponse(
-            total=len(self.records),
-            animals=animals,
-            by_class=by_class
-        )
+        return GalleryResponse.model_validate(self.snapshot())
     
     def reset(self):
         """Clear all records"""
-        self.records.clear()
-        self.features.clear()
+        self._ids.clear()
+        self._classes.clear()
+        self._id_to_slot.clear()
+        self._allocate(0)
         self.id_counters.clear()
         self.class_index.clear()
+        self.class_matrix.clear()
+        self.row_index.clear()
+        self.history.clear()
         logger.info("🗑️ Gallery reset")
     
     @property
     def size(self) -> int:
-        return len(self.records)
+        return len(self._ids)
 
 # ===========================================
 # Animal Detector
@@ -261,36 +504,176 @@ class AnimalDetector:
     
     def __init__(self):
         self.model = None
+        self.device = "cpu"
+        self.half = False
         self.extractor = FeatureExtractor()
         self.gallery = AnimalGallery()
         self.frame_count = 0
         self.track_id_counter = 0
+        # Content hash -> (gallery size, payload) of frames with no new animals, oldest first
+        self.frame_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        # Single worker: frames are processed off the event loop, one at a time
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detector")
     
     def initialize(self):
         """Load YOLO model"""
         try:
             from ultralytics import YOLO
-            self.model = YOLO(Config.MODEL_PATH)
-            logger.info("✅ YOLOv8 model loaded")
+            
+            # FP16 inference when a GPU is available
+            import torch
+            if torch.cuda.is_available():
+                self.device, self.half = 0, True
+            
+            model_path = Config.MODEL_PATH
+            if self.half and Config.USE_TENSORRT:
+                model_path = self._tensorrt_engine(YOLO) or model_path
+            
+            self.model = YOLO(model_path, task="detect")
+            logger.info(f"✅ YOLOv8 model loaded ({model_path}, device={self.device}, half={self.half})")
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}")
             raise
+        
+        self.warmup()
     
-    def process_frame(self, image: np.ndarray) -> ProcessResult:
-        """Process a single frame"""
-        start_time = time.time()
-        self.frame_count += 1
+    def _tensorrt_engine(self, yolo_cls) -> Optional[str]:
+        """Path of the FP16 TensorRT engine, exporting it on first start (None if unavailable)
+        
+        The engine is exported with a dynamic batch axis up to Config.MAX_BATCH
+        so FrameBatcher batches pass the engine's input shape check. The batch
+        size is part of the file name so an older static engine is not reused.
+        """
+        engine_path = f"{os.path.splitext(Config.MODEL_PATH)[0]}_b{Config.MAX_BATCH}.engine"
+        if os.path.exists(engine_path):
+            return engine_path
         
+        try:
+            logger.info("⚙️ Exporting TensorRT FP16 engine (one-time)...")
+            exported = yolo_cls(Config.MODEL_PATH).export(
+                format="engine",
+                half=True,
+                imgsz=Config.IMAGE_SIZE,
+                batch=Config.MAX_BATCH,
+                dynamic=True,
+                device=self.device
+            )
+            os.replace(exported, engine_path)
+            return engine_path
+        except Exception as e:
+            logger.warning(f"⚠️ TensorRT export failed, using PyTorch weights: {e}")
+            return None
+    
+    def warmup(self):
+        """Run a few blank frames so the first request doesn't pay CUDA/cuDNN setup"""
+        blank = np.zeros((Config.IMAGE_SIZE, Config.IMAGE_SIZE, 3), dtype=np.uint8)
+        for _ in range(Config.WARMUP_RUNS):
+            self.detect([blank])
+    
+    def detect(self, images: List[np.ndarray]) -> list:
+        """Run YOLO on a list of frames in a single forward pass (one result per frame)"""
         if self.model is None:
             self.initialize()
         
+        return self.model(
+            images,
+            verbose=False,
+            conf=Config.CONFIDENCE_THRESHOLD,
+            half=self.half,
+            device=self.device
+        )
+    
+    def process_batch(
+        self,
+        images: List[np.ndarray],
+        keys: Optional[List[Optional[bytes]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect on all frames at once, then re-identify them in submission order.
+        
+        Frames whose content key is cached (and the gallery has not grown
+        since) are answered from the cache without running the pipeline.
+        """
+        if keys is None:
+            keys = [None] * len(images)
+        payloads = [self.cached_frame(key) for key in keys]
+        
+        misses = [i for i, payload in enumerate(payloads) if payload is None]
+        if misses:
+            start_time = time.time()
+            results = self.detect([images[i] for i in misses])
+            for i, result in zip(misses, results):
+                payloads[i] = self.process_frame(images[i], [result], start_time)
+                if keys[i] is not None:
+                    self.cache_frame(keys[i], payloads[i])
+        
+        return payloads
+    
+    def cached_frame(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Cached payload of an identical earlier frame, restamped as a new frame"""
+        if key is None:
+            return None
+        entry = self.frame_cache.pop(key, None)
+        if entry is None or entry[0] != self.gallery.size:
+            return None
+        
+        self.frame_cache[key] = entry
+        self.frame_count += 1
+        return {**entry[1], "frame_id": self.frame_count, "timestamp": time.time()}
+    
+    def cache_frame(self, key: bytes, payload: Dict[str, Any]):
+        """Remember a processed frame, evicting the oldest entry when full
+        
+        Frames that registered new animals are not cached: replaying them
+        would report those animals as new again, while a fresh pass matches
+        them against the gallery.
+        """
+        if payload["new_this_frame"]:
+            return
+        self.frame_cache[key] = (self.gallery.size, payload)
+        while len(self.frame_cache) > Config.FRAME_CACHE_SIZE:
+            self.frame_cache.popitem(last=False)
+    
+    def reset_gallery(self):
+        """Clear the gallery and the frames cached against it (run on the executor)"""
+        self.gallery.reset()
+        self.frame_cache.clear()
+    
+    def retune_gallery(self, alpha: float) -> int:
+        """Rebuild gallery features with a new EMA factor (run on the executor)"""
+        updated = self.gallery.retune(alpha)
+        self.frame_cache.clear()
+        return updated
+    
+    def process_frame(
+        self,
+        image: np.ndarray,
+        results: Optional[list] = None,
+        start_time: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a single frame (optionally with YOLO results already computed).
+        
+        Returns a JSON-ready dict in the ProcessResult layout; the response
+        models only document the API and are not built per request.
+        """
+        if start_time is None:
+            start_time = time.time()
+        self.frame_count += 1
+        
         h, w = image.shape[:2]
+        bbox_max = np.array([w, h, w, h], dtype=np.int32)
         detected_animals = []
         new_this_frame = 0
-        used_ids = set()
+        # Per class: rows already matched in this frame
+        used_masks: Dict[str, np.ndarray] = {}
         
         # Run YOLO detection
-        results = self.model(image, verbose=False, conf=Config.CONFIDENCE_THRESHOLD)
+        if results is None:
+            results = self.detect([image])
+        
+        # One timestamp for every gallery write of this frame
+        now = time.time()
         
         # Process each detection
         detections = []
@@ -298,29 +681,38 @@ class AnimalDetector:
             if result.boxes is None:
                 continue
             
-            for box in result.boxes:
-                cls_id = int(box.cls[0].item())
-                
-                # Only process animals
-                if cls_id not in Config.ANIMAL_CLASS_IDS:
-                    continue
-                
-                class_name = Config.ANIMAL_NAMES.get(cls_id, 'unknown')
-                bbox = [int(v) for v in box.xyxy[0].cpu().numpy()]
-                confidence = float(box.conf[0].item())
-                
-                # Extract features
-                features = self.extractor.extract(image, bbox)
-                if features is None:
-                    continue
-                
+            # Pull each tensor to host once per result, not once per box
+            boxes = result.boxes
+            cls_ids = boxes.cls.cpu().numpy().astype(np.intp)
+            
+            # Only process animals
+            keep = Config.ANIMAL_CLASS_MASK[cls_ids]
+            
+            # Clip all boxes to the image at once and drop empty ones
+            xyxy = boxes.xyxy.cpu().numpy().astype(np.int32)
+            np.clip(xyxy, 0, bbox_max, out=xyxy)
+            keep &= (xyxy[:, 2] > xyxy[:, 0]) & (xyxy[:, 3] > xyxy[:, 1])
+            keep = np.flatnonzero(keep)
+            if keep.size == 0:
+                continue
+            
+            class_idxs = (cls_ids[keep] - Config.ANIMAL_CLASS_MIN).tolist()
+            confidences = boxes.conf.cpu().numpy()[keep].tolist()
+            bboxes = xyxy[keep].tolist()
+            
+            for bbox, confidence, class_idx in zip(bboxes, confidences, class_idxs):
                 detections.append({
                     "bbox": bbox,
                     "confidence": confidence,
-                    "class_name": class_name,
-                    "features": features
+                    "class_name": Config.ANIMAL_NAME_BY_CLASS[class_idx],
+                    "prefix": Config.PREFIX_BY_CLASS[class_idx],
                 })
         
+        # Extract features for all detections in one batch
+        features = self.extractor.extract_batch(image, [det["bbox"] for det in detections])
+        for det, feat in zip(detections, features):
+            det["features"] = feat
+        
         # Match detections to gallery (sorted by confidence)
         detections.sort(key=lambda x: x["confidence"], reverse=True)
         
@@ -329,81 +721,148 @@ class AnimalDetector:
             track_id = self.track_id_counter
             
             # Search gallery
-            matches = self.gallery.search(det["features"], det["class_name"])
+            class_name = det["class_name"]
+            sims, candidates = self.gallery.search_full(det["features"], class_name)
+            
+            used = used_masks.get(class_name)
+            if used is None:
+                used_masks[class_name] = used = np.zeros(sims.size, dtype=bool)
             
             # Find best unused match
-            best_match = None
-            for animal_id, similarity in matches:
-                if animal_id not in used_ids and similarity >= Config.SIMILARITY_THRESHOLD:
-                    best_match = (animal_id, similarity)
-                    break
+            eligible = np.flatnonzero(~used & (sims >= Config.SIMILARITY_THRESHOLD))
             
-            if best_match:
+            if eligible.size:
                 # Matched existing animal
-                animal_id, similarity = best_match
-                used_ids.add(animal_id)
-                self.gallery.update(animal_id, det["features"], det["confidence"])
+                row = eligible[np.argmax(sims[eligible])]
+                used[row] = True
+                animal_id, similarity = candidates[row], float(sims[row])
+                self.gallery.update(animal_id, det["features"], det["confidence"], now)
                 is_new = False
             else:
                 # Register new animal
                 animal_id = self.gallery.register(
                     det["features"],
                     det["class_name"],
-                    det["confidence"]
+                    det["confidence"],
+                    det["prefix"],
+                    now
                 )
-                used_ids.add(animal_id)
+                # The new row is taken for the rest of this frame
+                used_masks[class_name] = np.append(used, True)
                 similarity = 1.0
                 is_new = True
                 new_this_frame += 1
             
-            detected_animals.append(DetectedAnimal(
-                track_id=track_id,
-                animal_id=animal_id,
-                class_name=det["class_name"],
-                bbox=det["bbox"],
-                confidence=det["confidence"],
-                re_id_confidence=similarity,
-                is_identified=True,
-                is_new=is_new
-            ))
+            detected_animals.append({
+                "track_id": track_id,
+                "animal_id": animal_id,
+                "class_name": det["class_name"],
+                "bbox": det["bbox"],
+                "confidence": det["confidence"],
+                "re_id_confidence": similarity,
+                "is_identified": True,
+                "is_new": is_new,
+                "velocity": [0.0, 0.0],
+                "direction": 0.0,
+                "health_score": None,
+                "behavior": None
+            })
         
         # Calculate FPS
-        elapsed = time.time() - start_time
+        end_time = time.time()
+        elapsed = end_time - start_time
         fps = 1.0 / elapsed if elapsed > 0 else 0.0
         
-        return ProcessResult(
-            frame_id=self.frame_count,
-            timestamp=time.time(),
-            fps=fps,
-            animal_count=len(detected_animals),
-            total_registered=self.gallery.size,
-            new_this_frame=new_this_frame,
-            animals=detected_animals,
-            frame_size=[w, h]
-        )
+        return {
+            "frame_id": self.frame_count,
+            "timestamp": end_time,
+            "fps": fps,
+            "animal_count": len(detected_animals),
+            "total_registered": self.gallery.size,
+            "new_this_frame": new_this_frame,
+            "animals": detected_animals,
+            "frame_size": [w, h]
+        }
 
 # ===========================================
 # FastAPI App
 # ===========================================
 
+class FrameBatcher:
+    """Coalesces concurrent frames into batched detector calls"""
+    
+    def __init__(self, detector: AnimalDetector):
+        self.detector = detector
+        self.queue: asyncio.Queue = asyncio.Queue()
+    
+    async def submit(self, image: np.ndarray, key: Optional[bytes] = None) -> Dict[str, Any]:
+        """Queue a frame (with its optional content key) and wait for its processed result"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((image, key, future))
+        return await future
+    
+    async def run(self):
+        """Collect up to MAX_BATCH frames (or until BATCH_TIMEOUT) and process them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + Config.BATCH_TIMEOUT
+            while len(batch) < Config.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            images = [image for image, _, _ in batch]
+            keys = [key for _, key, _ in batch]
+            try:
+                payloads = await loop.run_in_executor(
+                    self.detector.executor, self.detector.process_batch, images, keys
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), payload in zip(batch, payloads):
+                if not future.done():
+                    future.set_result(payload)
+
 # Global detector instance
 detector: Optional[AnimalDetector] = None
+batcher: Optional[FrameBatcher] = None
+
+def decode_image(contents: bytes) -> Optional[np.ndarray]:
+    """Decode uploaded image bytes straight to a BGR array"""
+    return cv2.imdecode(np.frombuffer(contents, np.uint8), cv2.IMREAD_COLOR)
+
+def frame_key(contents: bytes) -> bytes:
+    """Content hash of an uploaded frame for the duplicate-frame cache"""
+    return hashlib.blake2b(contents, digest_size=16).digest()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize detector on startup"""
-    global detector
+    global detector, batcher
     logger.info("🚀 Starting Teknova AI Animal Tracking...")
     detector = AnimalDetector()
     detector.initialize()
+    batcher = FrameBatcher(detector)
+    batch_task = asyncio.create_task(batcher.run())
     yield
     logger.info("👋 Shutting down...")
+    batch_task.cancel()
 
 app = FastAPI(
     title="Teknova AI Animal Tracking",
     description="AI-powered animal detection and re-identification API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS - allow all origins for development
@@ -430,7 +889,8 @@ async def root():
             "health": "/health",
             "process": "/api/v1/detection/process-frame",
             "gallery": "/api/v1/detection/gallery",
-            "reset": "/api/v1/detection/reset"
+            "reset": "/api/v1/detection/reset",
+            "retune": "/api/v1/detection/retune"
         }
     }
 
@@ -443,32 +903,35 @@ async def health():
         "gallery_size": detector.gallery.size if detector else 0
     }
 
-@app.post("/api/v1/detection/process-frame")
+@app.post("/api/v1/detection/process-frame", responses={200: {"model": ProcessResult}})
 async def process_frame(file: UploadFile = File(...)):
     """Process uploaded image for animal detection"""
-    global detector
+    global detector, batcher
     
-    if detector is None:
+    if detector is None or batcher is None:
         raise HTTPException(status_code=503, detail="Detector not initialized")
     
     try:
-        # Read image
+        # Read and decode image without blocking the event loop
         contents = await file.read()
-        nparr = np.frombuffer(contents, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        loop = asyncio.get_running_loop()
+        key, image = await loop.run_in_executor(
+            None, lambda: (frame_key(contents), decode_image(contents))
+        )
         
         if image is None:
             raise HTTPException(status_code=400, detail="Invalid image")
         
-        # Process
-        result = detector.process_frame(image)
-        return result.model_dump()
+        # Detection is batched with concurrent requests on the detector's worker thread
+        return await batcher.submit(image, key)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Processing error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/v1/detection/gallery")
+@app.get("/api/v1/detection/gallery", responses={200: {"model": GalleryResponse}})
 async def get_gallery():
     """Get all registered animals"""
     global detector
@@ -476,7 +939,10 @@ async def get_gallery():
     if detector is None:
         raise HTTPException(status_code=503, detail="Detector not initialized")
     
-    return detector.gallery.get_all().model_dump()
+    # Gallery state is owned by the detector's worker thread; run there so
+    # reads and resets never interleave with an in-flight batch
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(detector.executor, detector.gallery.snapshot)
 
 @app.post("/api/v1/detection/reset")
 async def reset_gallery():
@@ -486,9 +952,22 @@ async def reset_gallery():
     if detector is None:
         raise HTTPException(status_code=503, detail="Detector not initialized")
     
-    detector.gallery.reset()
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(detector.executor, detector.reset_gallery)
     return {"status": "success", "message": "Gallery reset"}
 
+@app.post("/api/v1/detection/retune")
+async def retune_gallery(alpha: float = Query(..., gt=0.0, le=1.0)):
+    """Rebuild gallery features with a new EMA smoothing factor"""
+    global detector
+    
+    if detector is None:
+        raise HTTPException(status_code=503, detail="Detector not initialized")
+    
+    loop = asyncio.get_running_loop()
+    updated = await loop.run_in_executor(detector.executor, detector.retune_gallery, alpha)
+    return {"status": "success", "alpha": alpha, "updated": updated}
+
 # ===========================================
 # Main
 # ===========================================
@@ -4,18 +4,56 @@ Sistem Benchmark Scripti.
 
 Bu script sistemin temel bileşenlerinin performansını ölçer
 ve bir benchmark raporu oluşturur.
+
+Nesne oluşturma ölçümlerinde zaman damgaları ölçüm dışında bir kez
+alınır; sonuçlar saat okuma maliyetini değil, kararlı durumdaki
+nesne oluşturma maliyetini yansıtır.
 """
 
+import argparse
+import io
+import os
+import shutil
+import signal
+import subprocess
 import sys
 import time
+import timeit
 import asyncio
+import itertools
 import json
+import multiprocessing
+import statistics
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 import numpy as np
 
+# Numba derleme çıktıları çalıştırmalar arasında proje içinde saklanır
+os.environ.setdefault("NUMBA_CACHE_DIR", str(Path(__file__).resolve().parent.parent / ".numba_cache"))
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Proje root'unu path'e ekle
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -28,13 +66,147 @@ from src.core.profiler import (
 )
 
 
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+# perf örnekleme profilinde raporlanacak en sıcak fonksiyon sayısı
+PERF_TOP_N = 20
+
+# Veri üretiminde kullanılan isimler bir kez hazırlanır
+DATA_SIZE = 1000
+_ITEM_NAMES = tuple(f"item_{i}" for i in range(DATA_SIZE))
+_ANIMAL_IDS = tuple(f"animal_{i}" for i in range(DATA_SIZE))
+
+# --detailed-memory ile raporlanacak en çok bellek ayıran satır sayısı
+TOP_ALLOCATIONS_N = 10
+
+# timeit.repeat tur sayısı (en iyi tur kararlı durum ölçüsü olarak raporlanır)
+REPEAT = 5
+
+
+def _timer_overhead_ns(number: int = 100_000) -> float:
+    """timeit döngüsü + boş fonksiyon çağrısının çağrı başına maliyeti (ns)."""
+    runs = timeit.repeat(lambda: None, repeat=REPEAT, number=number, timer=time.perf_counter_ns)
+    return min(runs) / number
+
+
+def _preprocess_numpy(frame: np.ndarray, gray: np.ndarray) -> None:
+    """Gri dönüşüm: (b + g + r) // 3, uint16 tamponuna ara dizi ayırmadan."""
+    np.add(frame[..., 0], frame[..., 1], out=gray, dtype=np.uint16)
+    np.add(gray, frame[..., 2], out=gray)
+    np.floor_divide(gray, 3, out=gray)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _preprocess_numba(frame, gray):
+        """Gri dönüşümün satırlara paralel, derlenmiş karşılığı."""
+        for y in prange(frame.shape[0]):
+            for x in range(frame.shape[1]):
+                total = np.uint16(frame[y, x, 0]) + np.uint16(frame[y, x, 1]) + np.uint16(frame[y, x, 2])
+                gray[y, x] = total // 3
+
+    preprocess_frame = _preprocess_numba
+else:
+    preprocess_frame = _preprocess_numpy
+
+
+# Birbirinden bağımsız benchmark'lar (rapor sırası)
+BENCHMARKS = (
+    "_benchmark_detection_models",
+    "_benchmark_tracking",
+    "_benchmark_database",
+    "_benchmark_pipeline",
+    "_benchmark_export",
+)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Sürecin tepe RSS değeri (getrusage; tek bir sistem çağrısı)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS byte cinsinden raporlar
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _rss_bytes() -> Optional[int]:
+    """Sürecin anlık RSS değeri (psutil yoksa None)."""
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    """Byte değerini MB'a çevir (None korunur)."""
+    return None if value is None else round(value / (1 << 20), 2)
+
+
+def _run_with_memory(func) -> Dict[str, Optional[float]]:
+    """func'ı çalıştır; öncesi/sonrası RSS değerlerini (MB) döndür."""
+    start = _rss_bytes()
+    func()
+    end = _rss_bytes()
+    return {
+        "start_rss_mb": _mb(start),
+        "end_rss_mb": _mb(end),
+        "rss_diff_mb": None if end is None else _mb(end - start),
+    }
+
+
+def _run_isolated(method_name: str) -> Tuple[Dict[str, Any], str, Dict[str, Optional[float]]]:
+    """Tek bir benchmark'ı (alt süreçte) çalıştır; sonuçları, çıktısını ve belleğini döndür.
+    
+    Alt süreç yalnızca bu benchmark'ı çalıştırdığında (Python 3.11+)
+    tepe RSS de ona aittir.
+    """
+    suite = BenchmarkSuite(parallel=False)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        memory = _run_with_memory(getattr(suite, method_name))
+    peak = _peak_rss_mb()
+    memory["peak_rss_mb"] = None if peak is None else round(peak, 2)
+    return suite.results, output.getvalue(), memory
+
+
 class BenchmarkSuite:
     """Benchmark test suite."""
     
-    def __init__(self):
-        """Benchmark suite başlat."""
+    def __init__(
+        self,
+        parallel: Optional[bool] = None,
+        profile: bool = False,
+        detailed_memory: bool = False
+    ):
+        """
+        Benchmark suite başlat.
+        
+        Args:
+            parallel: Benchmark'ları ayrı süreçlerde eşzamanlı çalıştır
+                (None: birden fazla çekirdek varsa)
+            profile: Çalışma boyunca perf ile örnekleme profili al (Linux);
+                profil tek süreci izlediği için benchmark'lar sıralı çalışır
+            detailed_memory: tracemalloc ile satır bazında bellek ayırımlarını
+                raporla (ölçümleri yavaşlatır; benchmark'lar sıralı çalışır)
+        """
         self.results: Dict[str, Any] = {}
         self.start_time: datetime = datetime.now()
+        self.timer_overhead_ns: float = _timer_overhead_ns()
+        self.profile = profile
+        self.perf_top: Optional[List[str]] = None
+        self._perf_data: Optional[Path] = None
+        self.detailed_memory = detailed_memory
+        self.top_allocations: Optional[List[str]] = None
+        self.start_rss: Optional[int] = None
+        # Benchmark başına RSS ölçümleri (paralel modda alt süreçlerden gelir)
+        self.memory_by_benchmark: Dict[str, Dict[str, Optional[float]]] = {}
+        
+        if parallel is None:
+            parallel = (os.cpu_count() or 1) > 1
+        self.parallel = parallel and not profile and not detailed_memory
     
     def run_all(self) -> Dict[str, Any]:
         """Tüm benchmark'ları çalıştır."""
@@ -42,28 +214,98 @@ class BenchmarkSuite:
         print("🚀 AI HAYVAN TAKİP SİSTEMİ - BENCHMARK")
         print("=" * 60)
         
-        memory_profiler.take_snapshot("benchmark_start")
+        # Ana sürecin RSS'i başta ve sonda okunur; her benchmark'ın kendi
+        # RSS değişimi, paralel modda çalıştığı alt süreçte ölçülür
+        self.start_rss = _rss_bytes()
+        if self.detailed_memory and PSUTIL_AVAILABLE:
+            memory_profiler.take_snapshot("benchmark_start")
+            tracemalloc.start()
+        perf = self._start_perf() if self.profile else None
         
-        # Detection benchmarks
-        self._benchmark_detection_models()
+        if self.parallel:
+            # Her benchmark kendi sürecinde; çıktılar rapor sırasıyla basılır
+            workers = min(len(BENCHMARKS), os.cpu_count() or 1)
+            context = multiprocessing.get_context("spawn")
+            # Her benchmark taze bir süreçte (3.11+): tepe RSS yalnızca ona ait olur
+            fresh = {"max_tasks_per_child": 1} if sys.version_info >= (3, 11) else {}
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, **fresh) as executor:
+                futures = [executor.submit(_run_isolated, name) for name in BENCHMARKS]
+                for name, future in zip(BENCHMARKS, futures):
+                    results, output, memory = future.result()
+                    print(output, end="")
+                    self.results.update(results)
+                    self.memory_by_benchmark[name[len("_benchmark_"):]] = memory
+        else:
+            for name in BENCHMARKS:
+                self.memory_by_benchmark[name[len("_benchmark_"):]] = _run_with_memory(getattr(self, name))
         
-        # Tracking benchmarks
-        self._benchmark_tracking()
+        if perf is not None:
+            self.perf_top = self._stop_perf(perf)
         
-        # Database benchmarks
-        self._benchmark_database()
+        if self.detailed_memory:
+            top_stats = tracemalloc.take_snapshot().statistics("lineno")
+            tracemalloc.stop()
+            self.top_allocations = [str(stat) for stat in top_stats[:TOP_ALLOCATIONS_N]]
+            if PSUTIL_AVAILABLE:
+                memory_profiler.take_snapshot("benchmark_end")
         
-        # Pipeline benchmarks
-        self._benchmark_pipeline()
+        # Final report
+        return self._generate_report()
+    
+    def _start_perf(self) -> Optional[subprocess.Popen]:
+        """Bu sürece bağlı bir `perf record` örnekleyicisi başlat."""
+        if not sys.platform.startswith("linux") or shutil.which("perf") is None:
+            print("⚠ perf bulunamadı, örnekleme profili atlanıyor")
+            return None
         
-        # Export benchmarks
-        self._benchmark_export()
+        self._perf_data = project_root / "reports" / "perf.data"
+        self._perf_data.parent.mkdir(exist_ok=True)
+        process = subprocess.Popen(
+            ["perf", "record", "-F", "500", "-p", str(os.getpid()), "-o", str(self._perf_data)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        time.sleep(0.5)  # perf'in sürece bağlanması için
+        return process
+    
+    def _stop_perf(self, process: subprocess.Popen) -> List[str]:
+        """Örneklemeyi durdur ve en sıcak fonksiyonları döndür."""
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=30)
+            report = subprocess.run(
+                ["perf", "report", "--stdio", "--sort", "symbol", "-i", str(self._perf_data)],
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return []
         
-        # Memory snapshot
-        memory_profiler.take_snapshot("benchmark_end")
+        lines = [
+            line.strip() for line in report.stdout.splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+        return lines[:PERF_TOP_N]
+    
+    @staticmethod
+    def _first_call(func) -> float:
+        """Isınma çağrısı: ilk çağrının süresi (ms; JIT derleme/önbellek dahil)."""
+        start = time.perf_counter_ns()
+        func()
+        return (time.perf_counter_ns() - start) / 1_000_000
+    
+    def _measure(self, func, number: int) -> Tuple[float, float, float]:
+        """
+        func'ı timeit.repeat ile ölç.
         
-        # Final report
-        return self._generate_report()
+        REPEAT tur × number çağrı yapılır; kalibre edilmiş çağrı maliyeti
+        düşülür. Çağrı başına (en iyi, medyan, stdev) ms döner.
+        """
+        runs = timeit.repeat(func, repeat=REPEAT, number=number, timer=time.perf_counter_ns)
+        per_call = [max(run / number - self.timer_overhead_ns, 0.0) / 1_000_000 for run in runs]
+        return min(per_call), statistics.median(per_call), statistics.stdev(per_call)
     
     def _benchmark_detection_models(self):
         """Detection model benchmark'ları."""
@@ -74,10 +316,9 @@ class BenchmarkSuite:
             
             # Detection oluşturma benchmark
             iterations = 10000
-            start = time.perf_counter()
             
-            for i in range(iterations):
-                detection = Detection(
+            def create_detection():
+                return Detection(
                     bbox=(0, 0, 100, 100),
                     confidence=0.95,
                     class_id=16,
@@ -86,14 +327,16 @@ class BenchmarkSuite:
                     area=10000
                 )
             
-            duration = (time.perf_counter() - start) * 1000
-            per_item = duration / iterations
+            per_item, median, stdev = self._measure(create_detection, iterations)
             
             self.results["detection_creation"] = {
                 "iterations": iterations,
-                "total_ms": round(duration, 3),
+                "repeat": REPEAT,
+                "total_ms": round(per_item * iterations, 3),
                 "per_item_ms": round(per_item, 6),
-                "items_per_second": round(1000 / per_item, 0)
+                "median_ms": round(median, 6),
+                "stdev_ms": round(stdev, 6),
+                "items_per_second": round(1000 / per_item, 0) if per_item > 0 else 0
             }
             
             print(f"  ✓ Detection oluşturma: {per_item:.4f}ms/item ({iterations} iterasyon)")
@@ -112,24 +355,27 @@ class BenchmarkSuite:
             ]
             
             iterations = 5000
-            start = time.perf_counter()
+            frame_ids = itertools.count()
+            ts = datetime.now()
             
-            for i in range(iterations):
-                result = DetectionResult(
+            def create_result():
+                return DetectionResult(
                     detections=detections,
-                    frame_id=i,
-                    timestamp=datetime.now(),
+                    frame_id=next(frame_ids),
+                    timestamp=ts,
                     inference_time=15.0,
                     image_size=(640, 480)
                 )
             
-            duration = (time.perf_counter() - start) * 1000
-            per_item = duration / iterations
+            per_item, median, stdev = self._measure(create_result, iterations)
             
             self.results["detection_result_creation"] = {
                 "iterations": iterations,
-                "total_ms": round(duration, 3),
+                "repeat": REPEAT,
+                "total_ms": round(per_item * iterations, 3),
                 "per_item_ms": round(per_item, 6),
+                "median_ms": round(median, 6),
+                "stdev_ms": round(stdev, 6),
                 "detections_per_result": 10
             }
             
@@ -148,22 +394,28 @@ class BenchmarkSuite:
             
             # Track oluşturma benchmark
             iterations = 10000
-            start = time.perf_counter()
+            track_ids = itertools.count()
             
-            for i in range(iterations):
-                track = Track(
-                    track_id=i,
+            def create_track():
+                return Track(
+                    track_id=next(track_ids),
+                    class_id=16,
+                    class_name="dog",
                     bbox=(0, 0, 100, 100),
+                    center=(50, 50),
+                    confidence=0.9,
                     state=TrackState.TENTATIVE
                 )
             
-            duration = (time.perf_counter() - start) * 1000
-            per_item = duration / iterations
+            per_item, median, stdev = self._measure(create_track, iterations)
             
             self.results["track_creation"] = {
                 "iterations": iterations,
-                "total_ms": round(duration, 3),
+                "repeat": REPEAT,
+                "total_ms": round(per_item * iterations, 3),
                 "per_item_ms": round(per_item, 6),
+                "median_ms": round(median, 6),
+                "stdev_ms": round(stdev, 6),
             }
             
             print(f"  ✓ Track oluşturma: {per_item:.4f}ms/item")
@@ -171,8 +423,8 @@ class BenchmarkSuite:
             # ObjectTracker benchmark
             tracker = ObjectTracker()
             
-            # Fake detections
-            from src.detection import Detection
+            # Fake detections (tracker yalnızca track_id'li tespitleri izler)
+            from src.detection import Detection, DetectionResult
             
             iterations = 100
             detections_per_frame = 5
@@ -184,25 +436,38 @@ class BenchmarkSuite:
                     class_id=16,
                     class_name="dog",
                     center=(i*50+50, i*50+50),
-                    area=10000
+                    area=10000,
+                    track_id=i
                 )
                 for i in range(detections_per_frame)
             ]
-            
-            start = time.perf_counter()
-            
-            for i in range(iterations):
-                # Not: update fonksiyonun varlığını kontrol et
-                if hasattr(tracker, 'update'):
-                    tracker.update(fake_detections)
-            
-            duration = (time.perf_counter() - start) * 1000
-            per_frame = duration / iterations
+            fake_result = DetectionResult(
+                detections=fake_detections,
+                frame_id=0,
+                timestamp=time.time(),
+                inference_time=15.0,
+                image_size=(640, 480)
+            )
+            
+            # Not: update fonksiyonunun varlığı döngü dışında bir kez kontrol
+            # edilir ve metot yerel isme bağlanır
+            if not hasattr(tracker, 'update'):
+                return
+            update = tracker.update
+            
+            # İlk çağrı (derleme/önbellek ısınması) ölçüme katılmaz, ayrı raporlanır
+            first_call = self._first_call(lambda: update(fake_result))
+            per_frame, median, stdev = self._measure(lambda: update(fake_result), iterations)
             
             self.results["tracker_update"] = {
                 "iterations": iterations,
-                "total_ms": round(duration, 3),
+                "repeat": REPEAT,
+                "total_ms": round(per_frame * iterations, 3),
                 "per_frame_ms": round(per_frame, 4),
+                "first_call_ms": round(first_call, 4),
+                "steady_ms": round(per_frame, 4),
+                "median_ms": round(median, 4),
+                "stdev_ms": round(stdev, 4),
                 "fps_capacity": round(1000 / per_frame, 1) if per_frame > 0 else 0
             }
             
@@ -218,30 +483,43 @@ class BenchmarkSuite:
         
         try:
             # In-memory SQLite ile test
-            from sqlalchemy import create_engine
-            from sqlalchemy.orm import sessionmaker
+            from sqlalchemy import create_engine, event, select, bindparam
+            from sqlalchemy.pool import StaticPool
             from src.database.models import Base, Animal, Detection as DBDetection
             
-            engine = create_engine("sqlite:///:memory:")
-            Base.metadata.create_all(engine)
-            Session = sessionmaker(bind=engine)
-            session = Session()
+            # Tek paylaşılan bağlantı: :memory: DB'si bağlantılar/thread'ler
+            # arasında kaybolmaz, havuzdan bağlantı alma maliyeti de olmaz
+            engine = create_engine(
+                "sqlite:///:memory:",
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool
+            )
+            
+            # Toplu yazma için journal ve fsync kapalı (bellek içi DB'de WAL
+            # desteklenmez, journal bellekte tutulur)
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragma(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=MEMORY")
+                cursor.execute("PRAGMA synchronous=OFF")
+                cursor.close()
             
-            # Insert benchmark
-            iterations = 1000
-            start = time.perf_counter()
+            Base.metadata.create_all(engine)
             
-            for i in range(iterations):
-                animal = Animal(
-                    animal_id=f"animal_{i}",
-                    species="dog",
-                    first_seen=datetime.now()
-                )
-                session.add(animal)
+            # Insert benchmark: satırlar ölçüm dışında hazırlanır,
+            # tek transaction içinde toplu (executemany) INSERT yapılır
+            iterations = DATA_SIZE
+            now = datetime.now()
+            rows = [
+                {"id": animal_id, "class_name": "dog", "first_seen_at": now}
+                for animal_id in _ANIMAL_IDS
+            ]
+            start = time.perf_counter_ns()
             
-            session.commit()
+            with engine.begin() as conn:
+                conn.execute(Animal.__table__.insert(), rows)
             
-            duration = (time.perf_counter() - start) * 1000
+            duration = (time.perf_counter_ns() - start) / 1_000_000
             per_item = duration / iterations
             
             self.results["db_insert"] = {
@@ -253,14 +531,19 @@ class BenchmarkSuite:
             
             print(f"  ✓ DB Insert: {per_item:.4f}ms/item ({self.results['db_insert']['items_per_second']}/s)")
             
-            # Query benchmark
+            # Query benchmark: sorgu bir kez oluşturulur, derlenmiş hali
+            # SQLAlchemy önbelleğinden tek bağlantı üzerinde tekrar kullanılır
             iterations = 500
-            start = time.perf_counter()
+            stmt = select(Animal).where(Animal.class_name == bindparam("s")).limit(10)
             
-            for i in range(iterations):
-                results = session.query(Animal).filter(Animal.species == "dog").limit(10).all()
+            with engine.connect() as conn:
+                start = time.perf_counter_ns()
+                
+                for i in range(iterations):
+                    results = conn.execute(stmt, {"s": "dog"}).fetchall()
+                
+                duration = (time.perf_counter_ns() - start) / 1_000_000
             
-            duration = (time.perf_counter() - start) * 1000
             per_query = duration / iterations
             
             self.results["db_query"] = {
@@ -272,7 +555,7 @@ class BenchmarkSuite:
             
             print(f"  ✓ DB Query: {per_query:.4f}ms/query ({self.results['db_query']['queries_per_second']}/s)")
             
-            session.close()
+            engine.dispose()
             
         except Exception as e:
             print(f"  ✗ Database benchmark hatası: {e}")
@@ -285,29 +568,46 @@ class BenchmarkSuite:
         try:
             # Fake frame processing simulation
             iterations = 100
-            frame_size = (640, 480, 3)
+            frame_size = (480, 640, 3)
+            
+            # Sahte kareler önceden üretilip döngüde sırayla kullanılır:
+            # ölçüm RNG'yi ve kare ayırmayı değil, ön işlemeyi yansıtır
+            frame_pool = [
+                np.random.default_rng(seed).integers(0, 255, frame_size, dtype=np.uint8)
+                for seed in range(4)
+            ]
+            
+            # Gri çıktı tamponu döngü dışında bir kez ayrılır
+            gray = np.empty(frame_size[:2], dtype=np.uint16)
+            
+            # Numba JIT derlemesi ölçüme girmesin diye bir kez ısıt
+            first_call = self._first_call(lambda: preprocess_frame(frame_pool[0], gray))
             
             # NumPy operations benchmark
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             
             for i in range(iterations):
                 # Fake frame
-                frame = np.random.randint(0, 255, frame_size, dtype=np.uint8)
+                frame = frame_pool[i & 3]
                 
                 # Resize simulation
-                resized = frame[::2, ::2]  # Basit downscale
+                resized = frame[::2, ::2]  # Basit downscale (kopyasız görünüm)
                 
-                # Color conversion simulation
-                gray = frame.mean(axis=2)
+                # Color conversion simulation: (b + g + r) // 3 tamsayı
+                # alanında, float64'e genişletmeden
+                preprocess_frame(frame, gray)
             
-            duration = (time.perf_counter() - start) * 1000
+            duration = (time.perf_counter_ns() - start) / 1_000_000
             per_frame = duration / iterations
             
             self.results["frame_preprocessing"] = {
                 "iterations": iterations,
                 "total_ms": round(duration, 3),
                 "per_frame_ms": round(per_frame, 2),
-                "fps_capacity": round(1000 / per_frame, 1) if per_frame > 0 else 0
+                "first_call_ms": round(first_call, 2),
+                "steady_ms": round(per_frame, 2),
+                "fps_capacity": round(1000 / per_frame, 1) if per_frame > 0 else 0,
+                "backend": "numba" if NUMBA_AVAILABLE else "numpy"
             }
             
             print(f"  ✓ Frame preprocessing: {per_frame:.2f}ms/frame ({self.results['frame_preprocessing']['fps_capacity']} FPS)")
@@ -325,10 +625,11 @@ class BenchmarkSuite:
             import tempfile
             import os
             
-            # Test data
+            # Test data (tek zaman damgası, satır başına datetime.now() yok)
+            ts = datetime.now().isoformat()
             test_data = [
-                {"id": i, "name": f"item_{i}", "value": i * 1.5, "timestamp": datetime.now().isoformat()}
-                for i in range(1000)
+                {"id": i, "name": name, "value": i * 1.5, "timestamp": ts}
+                for i, name in enumerate(_ITEM_NAMES)
             ]
             
             # CSV Export benchmark
@@ -338,19 +639,21 @@ class BenchmarkSuite:
             exporter = CSVExporter(output_dir=os.path.dirname(csv_path))
             
             iterations = 50
-            start = time.perf_counter()
+            names = itertools.cycle([f"benchmark_{i}.csv" for i in range(iterations)])
             
-            for i in range(iterations):
-                exporter.export(test_data, filename=f"benchmark_{i}.csv")
-            
-            duration = (time.perf_counter() - start) * 1000
-            per_export = duration / iterations
+            export = exporter.export
+            per_export, median, stdev = self._measure(
+                lambda: export(test_data, filename=next(names)), iterations
+            )
             
             self.results["csv_export"] = {
                 "iterations": iterations,
+                "repeat": REPEAT,
                 "records_per_export": 1000,
-                "total_ms": round(duration, 3),
+                "total_ms": round(per_export * iterations, 3),
                 "per_export_ms": round(per_export, 2),
+                "median_ms": round(median, 2),
+                "stdev_ms": round(stdev, 2),
             }
             
             print(f"  ✓ CSV Export (1000 kayıt): {per_export:.2f}ms/export")
@@ -363,19 +666,21 @@ class BenchmarkSuite:
             # JSON Export benchmark
             exporter = JSONExporter(output_dir=os.path.dirname(csv_path))
             
-            start = time.perf_counter()
+            names = itertools.cycle([f"benchmark_{i}.json" for i in range(iterations)])
             
-            for i in range(iterations):
-                exporter.export(test_data, filename=f"benchmark_{i}.json")
-            
-            duration = (time.perf_counter() - start) * 1000
-            per_export = duration / iterations
+            export = exporter.export
+            per_export, median, stdev = self._measure(
+                lambda: export(test_data, filename=next(names)), iterations
+            )
             
             self.results["json_export"] = {
                 "iterations": iterations,
+                "repeat": REPEAT,
                 "records_per_export": 1000,
-                "total_ms": round(duration, 3),
+                "total_ms": round(per_export * iterations, 3),
                 "per_export_ms": round(per_export, 2),
+                "median_ms": round(median, 2),
+                "stdev_ms": round(stdev, 2),
             }
             
             print(f"  ✓ JSON Export (1000 kayıt): {per_export:.2f}ms/export")
@@ -393,21 +698,49 @@ class BenchmarkSuite:
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds()
         
-        # Memory comparison
-        memory_diff = memory_profiler.compare_snapshots(0, -1)
+        end_rss = _rss_bytes()
+        peak_rss = _peak_rss_mb()
+        if peak_rss is not None:
+            peak_rss = round(peak_rss, 2)
+        
+        if self.parallel:
+            # Benchmark ayırımları ana süreçte değil alt süreçlerde olur:
+            # değişim alt süreçlerin toplamı, tepe değer en büyüğüdür
+            diffs = [m["rss_diff_mb"] for m in self.memory_by_benchmark.values()]
+            rss_diff_mb = None if None in diffs else round(sum(diffs), 2)
+            peaks = [m["peak_rss_mb"] for m in self.memory_by_benchmark.values()] + [peak_rss]
+            peaks = [p for p in peaks if p is not None]
+            peak_rss = max(peaks) if peaks else None
+        else:
+            rss_diff_mb = None if end_rss is None else _mb(end_rss - self.start_rss)
         
         report = {
             "timestamp": end_time.isoformat(),
             "duration_seconds": round(duration, 2),
             "benchmarks": self.results,
             "memory": {
-                "start": memory_profiler.get_snapshots()[0] if memory_profiler.get_snapshots() else None,
-                "end": memory_profiler.get_snapshots()[-1] if memory_profiler.get_snapshots() else None,
-                "diff": memory_diff
+                "start_rss_mb": _mb(self.start_rss),
+                "end_rss_mb": _mb(end_rss),
+                "rss_diff_mb": rss_diff_mb,
+                "peak_rss_mb": peak_rss,
+                "mode": "parallel" if self.parallel else "sequential",
+                "per_benchmark": self.memory_by_benchmark
             },
             "profiler_summary": profiler.get_summary()
         }
         
+        if self.detailed_memory:
+            snapshots = memory_profiler.get_snapshots()
+            report["memory"]["snapshots"] = {
+                "start": snapshots[0] if snapshots else None,
+                "end": snapshots[-1] if snapshots else None,
+                "diff": memory_profiler.compare_snapshots(0, -1)
+            }
+            report["memory"]["top_allocations"] = self.top_allocations
+        
+        if self.perf_top is not None:
+            report["perf_top"] = self.perf_top
+        
         # Print summary
         print("\n" + "=" * 60)
         print("📊 BENCHMARK ÖZETİ")
@@ -415,8 +748,10 @@ class BenchmarkSuite:
         
         print(f"\nToplam Süre: {duration:.2f} saniye")
         
-        if "memory" in report and report["memory"]["diff"]:
-            print(f"Bellek Değişimi: {report['memory']['diff'].get('rss_diff_mb', 0):.2f} MB")
+        if rss_diff_mb is not None:
+            print(f"Bellek Değişimi: {report['memory']['rss_diff_mb']:.2f} MB")
+        else:
+            print("Bellek Değişimi: psutil yüklü değil, ölçülmedi")
         
         print("\n--- Performans Sonuçları ---")
         
@@ -436,7 +771,20 @@ class BenchmarkSuite:
 
 def main():
     """Ana benchmark fonksiyonu."""
-    suite = BenchmarkSuite()
+    parser = argparse.ArgumentParser(description="AI Animal Tracking benchmark")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under a perf sampling profiler (Linux) and report the hottest functions"
+    )
+    parser.add_argument(
+        "--detailed-memory",
+        action="store_true",
+        help="Trace allocations with tracemalloc and report the top allocation sites"
+    )
+    args = parser.parse_args()
+    
+    suite = BenchmarkSuite(profile=args.profile, detailed_memory=args.detailed_memory)
     report = suite.run_all()
     
     # Raporu dosyaya kaydet
@@ -445,8 +793,16 @@ def main():
     
     report_file = output_dir / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    if ORJSON_AVAILABLE:
+        # datetime/numpy tiplerini doğrudan serileştirir; bilinmeyenler str'e düşer
+        report_file.write_bytes(orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
+    else:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
     
     print(f"\n💾 Rapor kaydedildi: {report_file}")
     
@@ -8,15 +8,156 @@ YOLO ve diğer gerekli modelleri indirir.
 Kullanım:
     python scripts/download_models.py
     python scripts/download_models.py --models yolov8n yolov8s
+    python scripts/download_models.py --checksums models/checksums.sha256
 """
 
 import argparse
+import asyncio
+import hashlib
 import sys
+import urllib.request
 from pathlib import Path
+from typing import Dict, Optional
 
+try:
+    import aiohttp
+    import aiofiles
+    ASYNC_HTTP_AVAILABLE = True
+except ImportError:
+    ASYNC_HTTP_AVAILABLE = False
 
-def download_yolo_models(models: list, output_dir: Path):
-    """YOLO modellerini indir"""
+
+# Ultralytics'in YOLOv8 ağırlıklarını yayınladığı sürüm
+YOLO_ASSETS_URL = "https://github.com/ultralytics/assets/releases/download/v8.2.0"
+CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Ağırlıkların beklenen SHA-256 özetleri (dosya adı -> hex özet). Özeti
+# sabitlenmemiş modeller reddedilir; özetler sha256sum biçimindeki
+# models/checksums.sha256 dosyasından (veya --checksums ile) eklenir.
+# --allow-unpinned hesaplanan özeti yazdırarak doğrulamasız kabul eder.
+MODEL_SHA256: Dict[str, str] = {}
+
+
+def load_checksums(path: Path) -> Dict[str, str]:
+    """sha256sum biçimindeki dosyadan ("<özet>  <dosya adı>") özetleri oku"""
+    checksums = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        digest, name = line.split(maxsplit=1)
+        checksums[Path(name.lstrip("*")).name] = digest.lower()
+    return checksums
+
+
+def _verify(model_path: Path, digest: str, allow_unpinned: bool) -> bool:
+    """Hesaplanan özeti manifest ile karşılaştır"""
+    expected = MODEL_SHA256.get(model_path.name)
+    if expected is None:
+        if allow_unpinned:
+            print(f"⚠ {model_path.name} is not pinned, accepted unverified (sha256={digest})")
+            return True
+        print(f"❌ No pinned SHA-256 for {model_path.name} (got {digest}); "
+              f"pin it with --checksums or pass --allow-unpinned")
+        return False
+    
+    if digest != expected:
+        print(f"❌ SHA-256 mismatch for {model_path.name}: expected {expected}, got {digest}")
+        return False
+    return True
+
+
+def _finalize(part_path: Path, model_path: Path, digest: str, allow_unpinned: bool) -> Optional[bool]:
+    """Özeti doğrula ve .part dosyasını yerine taşı.
+    
+    Doğrulanamayan dosyalar silinir ve None döner; bu modeller doğrulamasız
+    yedek yoldan tekrar denenmez.
+    """
+    if not _verify(model_path, digest, allow_unpinned):
+        part_path.unlink()
+        return None
+    
+    part_path.replace(model_path)
+    print(f"✓ {model_path.name} downloaded")
+    return True
+
+
+def _file_sha256(path: Path) -> str:
+    """Diskteki dosyanın SHA-256 özeti"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def _fetch(session, url: str, model_path: Path, allow_unpinned: bool) -> Optional[bool]:
+    """Tek bir dosyayı parça parça diske indir (.part üzerinden atomik)"""
+    part_path = model_path.with_name(model_path.name + ".part")
+    hasher = hashlib.sha256()
+    
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                print(f"⚠ {model_path.name}: HTTP {response.status}")
+                return False
+            
+            # Özet, dosya tekrar okunmadan indirme sırasında hesaplanır
+            async with aiofiles.open(part_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await f.write(chunk)
+    except BaseException:
+        # Yarım kalan indirme diskte bırakılmaz
+        part_path.unlink(missing_ok=True)
+        raise
+    
+    return _finalize(part_path, model_path, hasher.hexdigest(), allow_unpinned)
+
+
+def _fetch_sync(url: str, model_path: Path, allow_unpinned: bool) -> Optional[bool]:
+    """aiohttp yoksa standart kütüphane ile sıralı indir"""
+    part_path = model_path.with_name(model_path.name + ".part")
+    hasher = hashlib.sha256()
+    
+    try:
+        with urllib.request.urlopen(url, timeout=60) as response, open(part_path, "wb") as f:
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                f.write(chunk)
+    except Exception as e:
+        part_path.unlink(missing_ok=True)
+        print(f"⚠ {model_path.name}: {e}")
+        return False
+    
+    return _finalize(part_path, model_path, hasher.hexdigest(), allow_unpinned)
+
+
+async def _download_all(model_names: list, output_dir: Path, allow_unpinned: bool) -> dict:
+    """Tüm modelleri eşzamanlı indir; model adı -> _fetch sonucu"""
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        results = await asyncio.gather(
+            *[
+                _fetch(session, f"{YOLO_ASSETS_URL}/{name}", output_dir / name, allow_unpinned)
+                for name in model_names
+            ],
+            return_exceptions=True
+        )
+    
+    status = {}
+    for name, result in zip(model_names, results):
+        if isinstance(result, Exception):
+            print(f"⚠ {name}: {result}")
+        status[name] = False if isinstance(result, Exception) else result
+    return status
+
+
+def _download_with_ultralytics(model_name: str, model_path: Path, allow_unpinned: bool) -> bool:
+    """Ultralytics'in kendi indiricisiyle indir (yedek yol), ardından özeti doğrula"""
     try:
         from ultralytics import YOLO
     except ImportError:
@@ -24,29 +165,61 @@ def download_yolo_models(models: list, output_dir: Path):
         print("Please run: pip install ultralytics")
         sys.exit(1)
     
+    try:
+        # Tam yol verildiğinde YOLO eksik ağırlığı o konuma indirir
+        YOLO(str(model_path))
+    except Exception as e:
+        print(f"❌ Failed to download {model_name}: {e}")
+        return False
+    
+    if not model_path.exists():
+        print(f"❌ Failed to download {model_name}")
+        return False
+    if not _verify(model_path, _file_sha256(model_path), allow_unpinned):
+        model_path.unlink()
+        return False
+    
+    print(f"✓ {model_name} ready")
+    return True
+
+
+def download_yolo_models(models: list, output_dir: Path, allow_unpinned: bool = False) -> bool:
+    """YOLO modellerini indir; tüm modeller hazır ve doğrulanmışsa True döner"""
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    pending = []
     for model_name in models:
         if not model_name.endswith(".pt"):
             model_name = f"{model_name}.pt"
         
-        model_path = output_dir / model_name
-        
-        if model_path.exists():
+        if (output_dir / model_name).exists():
             print(f"✓ {model_name} already exists")
-        else:
-            print(f"⬇ Downloading {model_name}...")
-            try:
-                model = YOLO(model_name)
-                # Model dosyasını hedef dizine kopyala
-                import shutil
-                from ultralytics import settings
-                
-                # YOLO varsayılan olarak ~/.cache/ultralytics klasörüne indirir
-                # Model zaten yüklendiği için doğrudan kullanılabilir
-                print(f"✓ {model_name} ready")
-            except Exception as e:
-                print(f"❌ Failed to download {model_name}: {e}")
+        elif model_name not in pending:
+            pending.append(model_name)
+    
+    if not pending:
+        return True
+    
+    # Önce tüm dosyalar doğrudan HTTP ile indirilir (torch/ultralytics yüklenmez)
+    print(f"⬇ Downloading {', '.join(pending)}...")
+    if ASYNC_HTTP_AVAILABLE:
+        status = asyncio.run(_download_all(pending, output_dir, allow_unpinned))
+    else:
+        status = {
+            name: _fetch_sync(f"{YOLO_ASSETS_URL}/{name}", output_dir / name, allow_unpinned)
+            for name in pending
+        }
+    
+    # Başarısız olanlar (ör. 404) ultralytics üzerinden sırayla denenir ve
+    # aynı manifestle doğrulanır; özeti tutmayanlar tekrar indirilmez
+    for model_name in pending:
+        if status[model_name] is False:
+            print(f"⬇ Downloading {model_name} via ultralytics...")
+            status[model_name] = _download_with_ultralytics(
+                model_name, output_dir / model_name, allow_unpinned
+            )
+    
+    return all(status[name] for name in pending)
 
 
 def main():
@@ -63,6 +236,18 @@ def main():
         default=None,
         help="Output directory for models"
     )
+    parser.add_argument(
+        "--checksums",
+        type=str,
+        default=None,
+        help="sha256sum-format file with pinned model digests "
+             "(default: models/checksums.sha256 if present)"
+    )
+    parser.add_argument(
+        "--allow-unpinned",
+        action="store_true",
+        help="Accept models without a pinned digest (prints the computed digest)"
+    )
     
     args = parser.parse_args()
     
@@ -80,9 +265,17 @@ def main():
     print(f"\nOutput directory: {output_dir}")
     print(f"Models to download: {args.models}\n")
     
-    download_yolo_models(args.models, output_dir)
+    checksums_path = Path(args.checksums) if args.checksums else project_root / "models" / "checksums.sha256"
+    if args.checksums or checksums_path.exists():
+        MODEL_SHA256.update(load_checksums(checksums_path))
+    
+    ok = download_yolo_models(args.models, output_dir, args.allow_unpinned)
     
     print("\n" + "=" * 50)
+    if not ok:
+        print("❌ Download failed or could not be verified")
+        print("=" * 50)
+        sys.exit(1)
     print("✅ Download complete!")
     print("=" * 50)
 
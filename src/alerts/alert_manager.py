@@ -15,14 +15,41 @@ import time
 from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from datetime import datetime, time as dt_time
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import json
-import uuid
+import secrets
+
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# How often expired deduplication entries are swept (seconds)
+DEDUP_SWEEP_INTERVAL = 60.0
+
+# Alert fields that identify a duplicate by default
+DEFAULT_DEDUP_FIELDS = ("rule_id", "camera_id", "animal_id", "message")
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a JSON payload to bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode('utf-8')
+
 
 class AlertType(Enum):
     """Types of alerts."""
@@ -62,15 +89,34 @@ class AlertType(Enum):
     CUSTOM = "custom"
 
 
-class AlertSeverity(Enum):
-    """Alert severity levels."""
-    INFO = "info"
-    WARNING = "warning"
-    CRITICAL = "critical"
-    EMERGENCY = "emergency"
+class AlertSeverity(IntEnum):
+    """Alert severity levels.
+    
+    Integer-valued so severities compare by rank and index lookup tables
+    directly; `label` is the string form used in serialized output.
+    """
+    INFO = 0
+    WARNING = 1
+    CRITICAL = 2
+    EMERGENCY = 3
+    
+    @property
+    def label(self) -> str:
+        """Serialized name ("info", "warning", ...)."""
+        return _SEVERITY_LABELS[self]
+    
+    @classmethod
+    def _missing_(cls, value):
+        # Accept the string labels, e.g. AlertSeverity("warning")
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+_SEVERITY_LABELS = tuple(severity.name.lower() for severity in AlertSeverity)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertRule:
     """Alert rule configuration."""
     id: str
@@ -89,6 +135,10 @@ class AlertRule:
     # Cooldown (prevent alert spam)
     cooldown_seconds: float = 300.0  # 5 minutes default
     
+    # Deduplication (collapse identical alerts within a window into one)
+    dedup_seconds: Optional[float] = None  # None disables deduplication
+    dedup_fields: Tuple[str, ...] = DEFAULT_DEDUP_FIELDS
+    
     # Schedule (optional - only alert during specific times)
     schedule_start: Optional[str] = None  # HH:MM format
     schedule_end: Optional[str] = None
@@ -106,9 +156,29 @@ class AlertRule:
     created_at: datetime = field(default_factory=datetime.now)
     last_triggered: Optional[datetime] = None
     trigger_count: int = 0
+    
+    # Notification channels resolved from notification_channels by AlertManager
+    _resolved_channels: List[Tuple[str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
+    # Parsed schedule (derived from schedule_start/schedule_end)
+    _start_time: Optional[dt_time] = field(default=None, init=False, repr=False, compare=False)
+    _end_time: Optional[dt_time] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._recompute_schedule()
+    
+    def _recompute_schedule(self) -> None:
+        """Parse the HH:MM schedule strings once."""
+        if self.schedule_start and self.schedule_end:
+            self._start_time = datetime.strptime(self.schedule_start, "%H:%M").time()
+            self._end_time = datetime.strptime(self.schedule_end, "%H:%M").time()
+        else:
+            self._start_time = self._end_time = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertNotification:
     """Alert notification instance."""
     id: str
@@ -135,13 +205,22 @@ class AlertNotification:
     resolved: bool = False
     resolved_at: Optional[datetime] = None
     
+    # Cached JSON payload (cleared whenever a serialized field changes)
+    _serialized: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes once and reuse for every channel."""
+        if self._serialized is None:
+            self._serialized = _dumps(self.to_dict())
+        return self._serialized
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'id': self.id,
             'rule_id': self.rule_id,
             'alert_type': self.alert_type.value,
-            'severity': self.severity.value,
+            'severity': self.severity.label,
             'title': self.title,
             'message': self.message,
             'details': self.details,
@@ -163,114 +242,204 @@ class AlertHistory:
             max_size: Maximum number of alerts to store
         """
         self.max_size = max_size
-        self.alerts: deque = deque(maxlen=max_size)
         self._lock = threading.Lock()
         
-        # Indices for fast lookup
-        self._by_type: Dict[AlertType, List[str]] = {}
-        self._by_severity: Dict[AlertSeverity, List[str]] = {}
-        self._by_camera: Dict[str, List[str]] = {}
-        self._by_animal: Dict[str, List[str]] = {}
-        self._unacknowledged: Set[str] = set()
-        self._unresolved: Set[str] = set()
+        # Preallocated ring buffer: _head is the next slot to write, the
+        # oldest alert sits _count slots behind it
+        self._ring: List[Optional[AlertNotification]] = [None] * max_size
+        self._head = 0
+        self._count = 0
+        
+        # Indices for fast lookup. Buckets are dicts used as insertion-ordered
+        # sets so lookups return alerts oldest first, like the history itself.
+        self._by_id: Dict[str, AlertNotification] = {}
+        self._by_type: Dict[AlertType, Dict[str, None]] = {}
+        self._by_severity: List[Dict[str, None]] = [{} for _ in AlertSeverity]
+        self._by_camera: Dict[str, Dict[str, None]] = {}
+        self._by_animal: Dict[str, Dict[str, None]] = {}
+        self._unacknowledged: Dict[str, None] = {}
+        self._unresolved: Dict[str, None] = {}
+        
+        # Running counts keyed by serialized label, for get_statistics
+        self._type_counts: Dict[str, int] = {}
+        self._severity_counts: Dict[str, int] = {}
     
     def add(self, alert: AlertNotification) -> None:
         """Add an alert to history."""
+        if self.max_size <= 0:
+            return
+        
         with self._lock:
-            self.alerts.append(alert)
-            
-            # Update indices
-            if alert.alert_type not in self._by_type:
-                self._by_type[alert.alert_type] = []
-            self._by_type[alert.alert_type].append(alert.id)
-            
-            if alert.severity not in self._by_severity:
-                self._by_severity[alert.severity] = []
-            self._by_severity[alert.severity].append(alert.id)
-            
-            if alert.camera_id:
-                if alert.camera_id not in self._by_camera:
-                    self._by_camera[alert.camera_id] = []
-                self._by_camera[alert.camera_id].append(alert.id)
-            
-            if alert.animal_id:
-                if alert.animal_id not in self._by_animal:
-                    self._by_animal[alert.animal_id] = []
-                self._by_animal[alert.animal_id].append(alert.id)
-            
-            if not alert.acknowledged:
-                self._unacknowledged.add(alert.id)
-            
-            if not alert.resolved:
-                self._unresolved.add(alert.id)
+            self._add_locked(alert)
+    
+    def add_many(self, alerts: List[AlertNotification]) -> None:
+        """Add several alerts under a single lock acquisition."""
+        if self.max_size <= 0:
+            return
+        
+        with self._lock:
+            for alert in alerts:
+                self._add_locked(alert)
+    
+    def _add_locked(self, alert: AlertNotification) -> None:
+        """Store an alert and update the indices (lock held by caller)."""
+        # A full ring overwrites its oldest alert; forget it in the indices
+        if self._count == self.max_size:
+            evicted = self._ring[self._head]
+            self._by_id.pop(evicted.id, None)
+            self._discard(self._by_type, evicted.alert_type, evicted.id)
+            self._by_severity[evicted.severity].pop(evicted.id, None)
+            if evicted.camera_id:
+                self._discard(self._by_camera, evicted.camera_id, evicted.id)
+            if evicted.animal_id:
+                self._discard(self._by_animal, evicted.animal_id, evicted.id)
+            self._unacknowledged.pop(evicted.id, None)
+            self._unresolved.pop(evicted.id, None)
+            self._decrement(self._type_counts, evicted.alert_type.value)
+            self._decrement(self._severity_counts, _SEVERITY_LABELS[evicted.severity])
+        
+        self._ring[self._head] = alert
+        self._head = (self._head + 1) % self.max_size
+        if self._count < self.max_size:
+            self._count += 1
+        self._by_id[alert.id] = alert
+        
+        # Update indices
+        type_label = alert.alert_type.value
+        self._type_counts[type_label] = self._type_counts.get(type_label, 0) + 1
+        severity_label = _SEVERITY_LABELS[alert.severity]
+        self._severity_counts[severity_label] = self._severity_counts.get(severity_label, 0) + 1
+        
+        self._by_type.setdefault(alert.alert_type, {})[alert.id] = None
+        self._by_severity[alert.severity][alert.id] = None
+        
+        if alert.camera_id:
+            self._by_camera.setdefault(alert.camera_id, {})[alert.id] = None
+        
+        if alert.animal_id:
+            self._by_animal.setdefault(alert.animal_id, {})[alert.id] = None
+        
+        if not alert.acknowledged:
+            self._unacknowledged[alert.id] = None
+        
+        if not alert.resolved:
+            self._unresolved[alert.id] = None
+    
+    @property
+    def alerts(self) -> List[AlertNotification]:
+        """All stored alerts, oldest first."""
+        with self._lock:
+            return self._newest(self._count)
+    
+    def _newest(self, count: int) -> List[AlertNotification]:
+        """Newest `count` alerts in chronological order (lock held by caller)."""
+        if count <= 0:
+            return []
+        start = (self._head - count) % self.max_size
+        end = start + count
+        if end <= self.max_size:
+            return self._ring[start:end]
+        return self._ring[start:] + self._ring[:self._head]
+    
+    @staticmethod
+    def _decrement(counts: Dict[str, int], key: str) -> None:
+        """Decrement a running count, dropping it at zero."""
+        remaining = counts[key] - 1
+        if remaining:
+            counts[key] = remaining
+        else:
+            del counts[key]
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[str, None]], key: Any, alert_id: str) -> None:
+        """Remove an alert ID from an index bucket, dropping empty buckets."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(alert_id, None)
+            if not bucket:
+                del index[key]
     
     def get(self, alert_id: str) -> Optional[AlertNotification]:
         """Get alert by ID."""
-        with self._lock:
-            for alert in self.alerts:
-                if alert.id == alert_id:
-                    return alert
-        return None
+        # A single dict lookup is atomic under the GIL; no lock needed
+        return self._by_id.get(alert_id)
     
     def acknowledge(self, alert_id: str, acknowledged_by: Optional[str] = None) -> bool:
         """Acknowledge an alert."""
+        now = datetime.now()
         with self._lock:
-            for alert in self.alerts:
-                if alert.id == alert_id:
-                    alert.acknowledged = True
-                    alert.acknowledged_at = datetime.now()
-                    alert.acknowledged_by = acknowledged_by
-                    self._unacknowledged.discard(alert_id)
-                    return True
-        return False
+            alert = self._by_id.get(alert_id)
+            if alert is None:
+                return False
+            
+            alert.acknowledged = True
+            alert.acknowledged_at = now
+            alert.acknowledged_by = acknowledged_by
+            alert._serialized = None
+            self._unacknowledged.pop(alert_id, None)
+            return True
     
     def resolve(self, alert_id: str) -> bool:
         """Resolve an alert."""
+        now = datetime.now()
         with self._lock:
-            for alert in self.alerts:
-                if alert.id == alert_id:
-                    alert.resolved = True
-                    alert.resolved_at = datetime.now()
-                    self._unresolved.discard(alert_id)
-                    return True
-        return False
+            alert = self._by_id.get(alert_id)
+            if alert is None:
+                return False
+            
+            alert.resolved = True
+            alert.resolved_at = now
+            alert._serialized = None
+            self._unresolved.pop(alert_id, None)
+            return True
     
     def get_recent(self, count: int = 100) -> List[AlertNotification]:
         """Get recent alerts."""
         with self._lock:
-            return list(self.alerts)[-count:]
+            if 0 < count < self._count:
+                # Slice only the newest `count` slots
+                return self._newest(count)
+            return self._newest(self._count)[-count:]
     
     def get_unacknowledged(self) -> List[AlertNotification]:
         """Get unacknowledged alerts."""
         with self._lock:
-            return [a for a in self.alerts if a.id in self._unacknowledged]
+            return [self._by_id[i] for i in self._unacknowledged]
     
     def get_unresolved(self) -> List[AlertNotification]:
         """Get unresolved alerts."""
         with self._lock:
-            return [a for a in self.alerts if a.id in self._unresolved]
+            return [self._by_id[i] for i in self._unresolved]
     
     def get_by_type(self, alert_type: AlertType) -> List[AlertNotification]:
         """Get alerts by type."""
         with self._lock:
-            ids = self._by_type.get(alert_type, [])
-            return [a for a in self.alerts if a.id in ids]
+            return [self._by_id[i] for i in self._by_type.get(alert_type, ())]
     
     def get_by_severity(self, severity: AlertSeverity) -> List[AlertNotification]:
         """Get alerts by severity."""
         with self._lock:
-            ids = self._by_severity.get(severity, [])
-            return [a for a in self.alerts if a.id in ids]
+            return [self._by_id[i] for i in self._by_severity[severity]]
+    
+    def get_by_camera(self, camera_id: str) -> List[AlertNotification]:
+        """Get alerts by camera."""
+        with self._lock:
+            return [self._by_id[i] for i in self._by_camera.get(camera_id, ())]
+    
+    def get_by_animal(self, animal_id: str) -> List[AlertNotification]:
+        """Get alerts by animal."""
+        with self._lock:
+            return [self._by_id[i] for i in self._by_animal.get(animal_id, ())]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get alert statistics."""
         with self._lock:
             stats = {
-                'total': len(self.alerts),
+                'total': self._count,
                 'unacknowledged': len(self._unacknowledged),
                 'unresolved': len(self._unresolved),
-                'by_type': {t.value: len(ids) for t, ids in self._by_type.items()},
-                'by_severity': {s.value: len(ids) for s, ids in self._by_severity.items()}
+                'by_type': dict(self._type_counts),
+                'by_severity': dict(self._severity_counts)
             }
             return stats
 
@@ -282,44 +451,121 @@ class NotificationChannel(ABC):
     def send(self, alert: AlertNotification) -> bool:
         """Send notification."""
         pass
+    
+    def send_batch(self, alerts: List[AlertNotification]) -> bool:
+        """Send several notifications; channels may override to coalesce them."""
+        return all([self.send(alert) for alert in alerts])
+    
+    def flush(self) -> bool:
+        """Deliver anything the channel has buffered."""
+        return True
 
 
 class LogNotificationChannel(NotificationChannel):
     """Log-based notification channel."""
     
+    # Logging level per AlertSeverity, indexed by severity
+    _LEVELS = (logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+    
     def send(self, alert: AlertNotification) -> bool:
         """Log the alert."""
-        severity_map = {
-            AlertSeverity.INFO: logging.INFO,
-            AlertSeverity.WARNING: logging.WARNING,
-            AlertSeverity.CRITICAL: logging.ERROR,
-            AlertSeverity.EMERGENCY: logging.CRITICAL
-        }
-        
-        level = severity_map.get(alert.severity, logging.INFO)
-        logger.log(level, f"[ALERT] {alert.title}: {alert.message}")
+        logger.log(self._LEVELS[alert.severity], f"[ALERT] {alert.title}: {alert.message}")
         return True
 
 
+# Keep-alive connection pool shared by all webhook channels
+_HTTP_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=32,
+    retries=urllib3.Retry(total=2, backoff_factor=0.1)
+) if URLLIB3_AVAILABLE else None
+
+
 class WebhookNotificationChannel(NotificationChannel):
     """Webhook notification channel."""
     
-    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        batch_window: float = 0.0
+    ):
         """Initialize webhook channel.
         
         Args:
             url: Webhook URL
             headers: Optional HTTP headers
+            batch_window: Seconds to collect alerts into one POST with a JSON
+                array body (0 sends each alert on its own)
         """
         self.url = url
-        self.headers = headers or {'Content-Type': 'application/json'}
+        self.headers = dict(headers or {'Content-Type': 'application/json'})
+        self._timeout = urllib3.Timeout(connect=2.0, read=10.0) if URLLIB3_AVAILABLE else None
+        
+        # Micro-batching
+        self._flush_after = batch_window
+        self._pending: deque = deque()
+        self._batch_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
     
     def send(self, alert: AlertNotification) -> bool:
-        """Send webhook notification."""
+        """Send webhook notification (or queue it for the next batch)."""
+        if self._flush_after <= 0:
+            return self._post(alert.to_json_bytes())
+        
+        self._enqueue((alert,))
+        return True
+    
+    def send_batch(self, alerts: List[AlertNotification]) -> bool:
+        """Queue alerts for the next batch, or POST each one when batching is off.
+        
+        Without a batch window receivers expect one alert object per
+        request, so alerts are only coalesced into a JSON array when
+        batch_window > 0.
+        """
+        if self._flush_after <= 0:
+            return all([self._post(alert.to_json_bytes()) for alert in alerts])
+        
+        self._enqueue(alerts)
+        return True
+    
+    def _enqueue(self, alerts: Iterable[AlertNotification]) -> None:
+        """Add alerts to the pending batch and arm the flush timer."""
+        with self._batch_lock:
+            self._pending.extend(alerts)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_after, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self) -> bool:
+        """Send all queued alerts as a single POST."""
+        with self._batch_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch = list(self._pending)
+            self._pending.clear()
+        
+        if not batch:
+            return True
+        return self._post(b'[' + b','.join(alert.to_json_bytes() for alert in batch) + b']')
+    
+    def _post(self, data: bytes) -> bool:
+        """POST a JSON body to the webhook URL."""
         try:
+            if _HTTP_POOL is not None:
+                response = _HTTP_POOL.request(
+                    'POST',
+                    self.url,
+                    body=data,
+                    headers=self.headers,
+                    timeout=self._timeout
+                )
+                return 200 <= response.status < 300
+            
             import urllib.request
             
-            data = json.dumps(alert.to_dict()).encode('utf-8')
             request = urllib.request.Request(
                 self.url,
                 data=data,
@@ -328,7 +574,7 @@ class WebhookNotificationChannel(NotificationChannel):
             )
             
             with urllib.request.urlopen(request, timeout=10) as response:
-                return response.status == 200
+                return 200 <= response.status < 300
         except Exception as e:
             logger.error(f"Webhook notification failed: {e}")
             return False
@@ -366,24 +612,35 @@ class AlertManager:
         """
         self.config = config or {}
         self.rules: Dict[str, AlertRule] = {}
+        self._rules_by_type: Dict[AlertType, List[AlertRule]] = {}
         self.history = AlertHistory()
         self.channels: Dict[str, NotificationChannel] = {}
         
-        # Cooldown tracking
-        self._rule_last_triggered: Dict[str, datetime] = {}
+        # Cooldown tracking (time.monotonic() of the last trigger per rule)
+        self._rule_last_triggered: Dict[str, float] = {}
+        
+        # Deduplication: fingerprint -> (expires_at, alert_id, count), monotonic
+        self._dedup_state: Dict[Tuple, Tuple[float, str, int]] = {}
+        self._last_dedup_sweep = time.monotonic()
         
         # Event callbacks
         self._alert_callbacks: List[Callable[[AlertNotification], None]] = []
         
-        # Lock for thread safety
-        self._lock = threading.Lock()
+        # Lock for per-trigger state (rule counters, deduplication); reentrant
+        # so trigger_bulk can hold it across a whole batch
+        self._lock = threading.RLock()
+        
+        # Lock for rule mutation only; trigger() reads self.rules without it
+        # (single dict lookups are atomic under the GIL)
+        self._rules_lock = threading.Lock()
         
         # Background processor
         self._running = False
         self._thread: Optional[threading.Thread] = None
         
-        # Alert queue for async processing
+        # Alert queue for async processing: (notifications, channels, run callbacks)
         self._alert_queue: deque = deque(maxlen=1000)
+        self._queue_event = threading.Event()
         
         # Setup default channels
         self._setup_default_channels()
@@ -469,23 +726,89 @@ class AlertManager:
         for rule in default_rules:
             self.add_rule(rule)
     
+    def start(self) -> None:
+        """Start dispatching notifications on a background thread.
+        
+        Until started (and after stop), notifications are sent inline by
+        the triggering thread.
+        """
+        if self._running:
+            return
+        
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._drain_loop, name="AlertDispatcher", daemon=True
+        )
+        self._thread.start()
+        logger.info("Alert dispatcher started")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background dispatcher and deliver anything still queued."""
+        if not self._running:
+            return
+        
+        self._running = False
+        self._queue_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        
+        self._drain_queue()
+        for channel in self.channels.values():
+            channel.flush()
+        logger.info("Alert dispatcher stopped")
+    
+    def _drain_loop(self) -> None:
+        """Background loop delivering queued notifications."""
+        while self._running:
+            self._queue_event.wait(timeout=DEDUP_SWEEP_INTERVAL)
+            self._queue_event.clear()
+            self._drain_queue()
+            
+            if time.monotonic() - self._last_dedup_sweep >= DEDUP_SWEEP_INTERVAL:
+                self.cleanup_expired_state()
+    
+    def _drain_queue(self) -> None:
+        """Deliver every queued notification."""
+        while True:
+            try:
+                notifications, channels, run_callbacks = self._alert_queue.popleft()
+            except IndexError:
+                return
+            self._deliver(notifications, channels, run_callbacks)
+    
     def add_rule(self, rule: AlertRule) -> None:
         """Add an alert rule."""
-        with self._lock:
+        rule._recompute_schedule()
+        self._resolve_channels(rule)
+        with self._rules_lock:
+            replaced = self.rules.get(rule.id)
             self.rules[rule.id] = rule
+            self._index_rule_type(rule.alert_type)
+            if replaced is not None and replaced.alert_type != rule.alert_type:
+                self._index_rule_type(replaced.alert_type)
             logger.debug(f"Added alert rule: {rule.name}")
     
     def remove_rule(self, rule_id: str) -> bool:
         """Remove an alert rule."""
-        with self._lock:
-            if rule_id in self.rules:
-                del self.rules[rule_id]
+        with self._rules_lock:
+            rule = self.rules.pop(rule_id, None)
+            if rule is not None:
+                self._index_rule_type(rule.alert_type)
                 return True
         return False
     
+    def _index_rule_type(self, alert_type: AlertType) -> None:
+        """Rebuild the rule list of one alert type (rule order preserved)."""
+        rules = [r for r in self.rules.values() if r.alert_type == alert_type]
+        if rules:
+            self._rules_by_type[alert_type] = rules
+        else:
+            self._rules_by_type.pop(alert_type, None)
+    
     def enable_rule(self, rule_id: str) -> bool:
         """Enable an alert rule."""
-        with self._lock:
+        with self._rules_lock:
             if rule_id in self.rules:
                 self.rules[rule_id].enabled = True
                 return True
@@ -493,7 +816,7 @@ class AlertManager:
     
     def disable_rule(self, rule_id: str) -> bool:
         """Disable an alert rule."""
-        with self._lock:
+        with self._rules_lock:
             if rule_id in self.rules:
                 self.rules[rule_id].enabled = False
                 return True
@@ -502,16 +825,35 @@ class AlertManager:
     def add_channel(self, name: str, channel: NotificationChannel) -> None:
         """Add a notification channel."""
         self.channels[name] = channel
+        with self._rules_lock:
+            for rule in self.rules.values():
+                self._resolve_channels(rule)
+    
+    def _resolve_channel_list(self, channel_names: List[str]) -> List[Tuple[str, NotificationChannel]]:
+        """Look up channel objects by name, skipping unknown names."""
+        return [
+            (name, self.channels[name]) for name in channel_names if name in self.channels
+        ]
     
-    def add_webhook(self, name: str, url: str, headers: Optional[Dict[str, str]] = None) -> None:
+    def _resolve_channels(self, rule: AlertRule) -> None:
+        """Cache the rule's notification channel objects."""
+        rule._resolved_channels = self._resolve_channel_list(rule.notification_channels)
+    
+    def add_webhook(
+        self,
+        name: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        batch_window: float = 0.0
+    ) -> None:
         """Add a webhook notification channel."""
-        self.add_channel(name, WebhookNotificationChannel(url, headers))
+        self.add_channel(name, WebhookNotificationChannel(url, headers, batch_window))
     
     def add_callback(self, callback: Callable[[AlertNotification], None]) -> None:
         """Add an alert callback."""
         self._alert_callbacks.append(callback)
     
-    def _can_trigger(self, rule: AlertRule) -> bool:
+    def _can_trigger(self, rule: AlertRule, now_mono: Optional[float] = None) -> bool:
         """Check if a rule can be triggered (cooldown check)."""
         if not rule.enabled:
             return False
@@ -520,35 +862,91 @@ class AlertManager:
         if last_triggered is None:
             return True
         
-        elapsed = (datetime.now() - last_triggered).total_seconds()
-        return elapsed >= rule.cooldown_seconds
+        if now_mono is None:
+            now_mono = time.monotonic()
+        return now_mono - last_triggered >= rule.cooldown_seconds
     
-    def _check_schedule(self, rule: AlertRule) -> bool:
+    def _check_schedule(self, rule: AlertRule, now: Optional[datetime] = None) -> bool:
         """Check if current time is within rule schedule."""
-        if not rule.schedule_start or not rule.schedule_end:
+        start = rule._start_time
+        end = rule._end_time
+        if start is None or end is None:
             return True
         
-        now = datetime.now().time()
-        start = datetime.strptime(rule.schedule_start, "%H:%M").time()
-        end = datetime.strptime(rule.schedule_end, "%H:%M").time()
+        now = (now or datetime.now()).time()
         
         if start <= end:
             return start <= now <= end
         else:  # Overnight schedule
             return now >= start or now <= end
     
+    @staticmethod
+    def _dedup_key(
+        rule: AlertRule,
+        title: str,
+        message: str,
+        camera_id: Optional[str],
+        animal_id: Optional[str]
+    ) -> Tuple:
+        """Build the content fingerprint used for deduplication."""
+        values = {
+            'rule_id': rule.id,
+            'title': title,
+            'message': message,
+            'camera_id': camera_id,
+            'animal_id': animal_id
+        }
+        return tuple(values.get(name) for name in rule.dedup_fields)
+    
+    def _find_duplicate(self, key: Tuple, now: float) -> Optional[AlertNotification]:
+        """Return the alert a fingerprint collapses into, counting the repeat."""
+        with self._lock:
+            state = self._dedup_state.get(key)
+            if state is None or now >= state[0]:
+                return None
+            
+            expires_at, alert_id, count = state
+            alert = self.history.get(alert_id)
+            if alert is None:  # Already evicted from history
+                return None
+            
+            count += 1
+            self._dedup_state[key] = (expires_at, alert_id, count)
+            alert.details['dedup_count'] = count
+            alert._serialized = None
+            return alert
+    
+    def cleanup_expired_state(self, now: Optional[float] = None) -> int:
+        """Drop deduplication entries whose window has passed.
+        
+        Args:
+            now: Current time.monotonic() value
+            
+        Returns:
+            Number of removed entries
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            expired = [k for k, state in self._dedup_state.items() if now >= state[0]]
+            for key in expired:
+                del self._dedup_state[key]
+            self._last_dedup_sweep = now
+        return len(expired)
+    
     def _create_notification(
         self,
         rule: AlertRule,
         title: str,
         message: str,
+        now: datetime,
         details: Optional[Dict[str, Any]] = None,
         camera_id: Optional[str] = None,
         animal_id: Optional[str] = None
     ) -> AlertNotification:
-        """Create an alert notification."""
+        """Create an alert notification stamped with the trigger's `now`."""
         return AlertNotification(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             rule_id=rule.id,
             alert_type=rule.alert_type,
             severity=rule.severity,
@@ -556,7 +954,8 @@ class AlertManager:
             message=message,
             details=details or {},
             camera_id=camera_id,
-            animal_id=animal_id
+            animal_id=animal_id,
+            timestamp=now
         )
     
     def trigger(
@@ -586,40 +985,140 @@ class AlertManager:
             logger.warning(f"Alert rule not found: {rule_id}")
             return None
         
-        if not self._can_trigger(rule):
-            logger.debug(f"Alert rule in cooldown: {rule_id}")
-            return None
+        # Clocks are read once per trigger: monotonic for cooldown and
+        # deduplication windows, wall clock for schedule and display
+        now_mono = time.monotonic()
+        if rule.dedup_seconds and not self._running:
+            self._maybe_sweep(now_mono)
         
-        if not self._check_schedule(rule):
-            logger.debug(f"Alert rule outside schedule: {rule_id}")
-            return None
+        notification, is_new = self._evaluate(
+            rule, title, message, details, camera_id, animal_id, now_mono, datetime.now()
+        )
+        if not is_new:
+            return notification
+        
+        # Add to history
+        self.history.add(notification)
+        
+        # Send notifications and call callbacks
+        self._dispatch([notification], rule._resolved_channels)
+        
+        logger.info(f"Alert triggered: {title}")
+        return notification
+    
+    def trigger_bulk(self, events: List[Dict[str, Any]]) -> List[Optional[AlertNotification]]:
+        """Trigger many alerts at once (e.g. one per tracked animal in a frame).
+        
+        Each event is a dict with the arguments of `trigger` (rule_id, title,
+        message and optionally details, camera_id, animal_id). Events are
+        evaluated exactly as sequential `trigger` calls would be, but the
+        clocks are read once, rule state is updated under one lock
+        acquisition, history is written in one batch and each rule's new
+        alerts reach each channel as one batch.
+        
+        Returns:
+            Result per event, in order (as `trigger` would return it)
+        """
+        results: List[Optional[AlertNotification]] = [None] * len(events)
+        new_by_rule: Dict[str, List[AlertNotification]] = {}
+        rules: Dict[str, Optional[AlertRule]] = {}
+        
+        now_mono = time.monotonic()
+        now = datetime.now()
+        if not self._running:
+            self._maybe_sweep(now_mono)
+        
+        with self._lock:
+            for i, event in enumerate(events):
+                rule_id = event['rule_id']
+                if rule_id not in rules:
+                    rules[rule_id] = self.rules.get(rule_id)
+                    if rules[rule_id] is None:
+                        logger.warning(f"Alert rule not found: {rule_id}")
+                rule = rules[rule_id]
+                if rule is None:
+                    continue
+                
+                notification, is_new = self._evaluate(
+                    rule,
+                    event['title'],
+                    event['message'],
+                    event.get('details'),
+                    event.get('camera_id'),
+                    event.get('animal_id'),
+                    now_mono,
+                    now
+                )
+                results[i] = notification
+                if is_new:
+                    new_by_rule.setdefault(rule_id, []).append(notification)
+        
+        if new_by_rule:
+            self.history.add_many([n for batch in new_by_rule.values() for n in batch])
+            for rule_id, batch in new_by_rule.items():
+                self._dispatch(batch, rules[rule_id]._resolved_channels)
+            logger.info(f"Alerts triggered: {sum(len(b) for b in new_by_rule.values())}")
+        
+        return results
+    
+    def _maybe_sweep(self, now_mono: float) -> None:
+        """Sweep expired deduplication state when no dispatcher thread does it."""
+        if now_mono - self._last_dedup_sweep >= DEDUP_SWEEP_INTERVAL:
+            self.cleanup_expired_state(now_mono)
+    
+    def _evaluate(
+        self,
+        rule: AlertRule,
+        title: str,
+        message: str,
+        details: Optional[Dict[str, Any]],
+        camera_id: Optional[str],
+        animal_id: Optional[str],
+        now_mono: float,
+        now: datetime
+    ) -> Tuple[Optional[AlertNotification], bool]:
+        """Apply cooldown, schedule and deduplication, then create the alert.
+        
+        Returns:
+            (alert, is_new): the new alert, the earlier alert a duplicate
+            collapsed into (is_new False), or (None, False) when suppressed
+        """
+        if not self._can_trigger(rule, now_mono):
+            logger.debug(f"Alert rule in cooldown: {rule.id}")
+            return None, False
+        
+        if not self._check_schedule(rule, now):
+            logger.debug(f"Alert rule outside schedule: {rule.id}")
+            return None, False
+        
+        # Collapse repeats of an identical alert into the first one
+        dedup_key = None
+        if rule.dedup_seconds:
+            dedup_key = self._dedup_key(rule, title, message, camera_id, animal_id)
+            duplicate = self._find_duplicate(dedup_key, now_mono)
+            if duplicate is not None:
+                logger.debug(f"Duplicate alert suppressed: {rule.id}")
+                return duplicate, False
         
         # Create notification
         notification = self._create_notification(
-            rule, title, message, details, camera_id, animal_id
+            rule, title, message, now, details, camera_id, animal_id
         )
         
         # Update rule state
         with self._lock:
-            rule.last_triggered = datetime.now()
+            rule.last_triggered = now
             rule.trigger_count += 1
-            self._rule_last_triggered[rule_id] = rule.last_triggered
-        
-        # Add to history
-        self.history.add(notification)
-        
-        # Send notifications
-        self._send_notifications(notification, rule.notification_channels)
-        
-        # Call callbacks
-        for callback in self._alert_callbacks:
-            try:
-                callback(notification)
-            except Exception as e:
-                logger.error(f"Alert callback error: {e}")
+            self._rule_last_triggered[rule.id] = now_mono
+            
+            if dedup_key is not None:
+                self._dedup_state[dedup_key] = (
+                    now_mono + rule.dedup_seconds,
+                    notification.id,
+                    1
+                )
         
-        logger.info(f"Alert triggered: {title}")
-        return notification
+        return notification, True
     
     def trigger_by_type(
         self,
@@ -635,42 +1134,79 @@ class AlertManager:
         
         Finds the first matching enabled rule for the alert type.
         """
-        for rule in self.rules.values():
-            if rule.alert_type == alert_type and rule.enabled:
+        for rule in self._rules_by_type.get(alert_type, ()):
+            if rule.enabled:
                 return self.trigger(
                     rule.id, title, message, details, camera_id, animal_id
                 )
         
         # If no rule found, create ad-hoc alert
         notification = AlertNotification(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             rule_id="ad_hoc",
             alert_type=alert_type,
-            severity=severity or AlertSeverity.INFO,
+            severity=severity if severity is not None else AlertSeverity.INFO,
             title=title,
             message=message,
             details=details or {},
             camera_id=camera_id,
-            animal_id=animal_id
+            animal_id=animal_id,
+            timestamp=datetime.now()
         )
         
         self.history.add(notification)
-        self._send_notifications(notification, ['log'])
+        self._dispatch([notification], self._resolve_channel_list(['log']), run_callbacks=False)
         return notification
     
-    def _send_notifications(
+    def _dispatch(
+        self,
+        notifications: List[AlertNotification],
+        channels: List[Tuple[str, NotificationChannel]],
+        run_callbacks: bool = True
+    ) -> None:
+        """Hand notifications to the dispatcher, or deliver them inline if not running."""
+        if not self._running:
+            self._deliver(notifications, channels, run_callbacks)
+            return
+        
+        if len(self._alert_queue) == self._alert_queue.maxlen:
+            logger.warning("Alert queue full, dropping oldest queued notification")
+        self._alert_queue.append((notifications, channels, run_callbacks))
+        self._queue_event.set()
+    
+    def _deliver(
         self,
-        notification: AlertNotification,
-        channel_names: List[str]
+        notifications: List[AlertNotification],
+        channels: List[Tuple[str, NotificationChannel]],
+        run_callbacks: bool = True
     ) -> None:
-        """Send notification to specified channels."""
-        for name in channel_names:
-            channel = self.channels.get(name)
-            if channel:
+        """Send notifications to their channels and call the alert callbacks."""
+        self._send_notifications(notifications, channels)
+        
+        if not run_callbacks:
+            return
+        
+        for notification in notifications:
+            for callback in self._alert_callbacks:
                 try:
-                    channel.send(notification)
+                    callback(notification)
                 except Exception as e:
-                    logger.error(f"Failed to send notification via {name}: {e}")
+                    logger.error(f"Alert callback error: {e}")
+    
+    def _send_notifications(
+        self,
+        notifications: List[AlertNotification],
+        channels: List[Tuple[str, NotificationChannel]]
+    ) -> None:
+        """Send notifications to pre-resolved (name, channel) pairs."""
+        for name, channel in channels:
+            try:
+                if len(notifications) == 1:
+                    channel.send(notifications[0])
+                else:
+                    channel.send_batch(notifications)
+            except Exception as e:
+                logger.error(f"Failed to send notification via {name}: {e}")
     
     # Health-related alerts
     def check_health_alert(
@@ -700,6 +1236,44 @@ class AlertManager:
             )
         return None
     
+    def check_health_batch(
+        self,
+        animal_health_scores: Dict[str, float],
+        camera_id: Optional[str] = None
+    ) -> Dict[str, AlertNotification]:
+        """Check health scores of many animals and trigger alerts in one batch.
+        
+        Returns:
+            Alerts by animal ID, for animals that produced one
+        """
+        events = []
+        for animal_id, health_score in animal_health_scores.items():
+            if health_score < 30:
+                events.append({
+                    'rule_id': "health_critical",
+                    'title': f"Critical Health Alert - Animal {animal_id}",
+                    'message': f"Health score critically low: {health_score:.1f}%",
+                    'details': {'health_score': health_score},
+                    'camera_id': camera_id,
+                    'animal_id': animal_id
+                })
+            elif health_score < 60:
+                events.append({
+                    'rule_id': "health_warning",
+                    'title': f"Health Warning - Animal {animal_id}",
+                    'message': f"Health score low: {health_score:.1f}%",
+                    'details': {'health_score': health_score},
+                    'camera_id': camera_id,
+                    'animal_id': animal_id
+                })
+        
+        results = self.trigger_bulk(events)
+        return {
+            event['animal_id']: alert
+            for event, alert in zip(events, results)
+            if alert is not None
+        }
+    
     def check_lameness_alert(
         self,
         animal_id: str,
@@ -859,12 +1433,14 @@ class AlertManager:
                     'id': r.id,
                     'name': r.name,
                     'alert_type': r.alert_type.value,
-                    'severity': r.severity.value,
+                    'severity': r.severity.label,
                     'enabled': r.enabled,
                     'conditions': r.conditions,
                     'threshold_value': r.threshold_value,
                     'threshold_duration': r.threshold_duration,
                     'cooldown_seconds': r.cooldown_seconds,
+                    'dedup_seconds': r.dedup_seconds,
+                    'dedup_fields': list(r.dedup_fields),
                     'schedule_start': r.schedule_start,
                     'schedule_end': r.schedule_end,
                     'notification_channels': r.notification_channels
@@ -887,6 +1463,8 @@ class AlertManager:
                 threshold_value=rule_data.get('threshold_value'),
                 threshold_duration=rule_data.get('threshold_duration'),
                 cooldown_seconds=rule_data.get('cooldown_seconds', 300),
+                dedup_seconds=rule_data.get('dedup_seconds'),
+                dedup_fields=tuple(rule_data.get('dedup_fields', DEFAULT_DEDUP_FIELDS)),
                 schedule_start=rule_data.get('schedule_start'),
                 schedule_end=rule_data.get('schedule_end'),
                 notification_channels=rule_data.get('notification_channels', ['log'])
@@ -2,11 +2,81 @@
 Dashboard Veri Sağlayıcı Modülü
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+import heapq
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
+from src.compat import DATACLASS_SLOTS
+
+
+# Sağlık skoru kategori sınırları ve etiketleri (yüksekten düşüğe)
+_HEALTH_BINS = (30, 50, 70, 90)
+_HEALTH_CATEGORIES = (
+    'Mükemmel (90-100)',
+    'İyi (70-89)',
+    'Orta (50-69)',
+    'Dikkat (30-49)',
+    'Kritik (0-29)'
+)
+
+# Türkçe davranış etiketleri
+_BEHAVIOR_LABELS_TR = {
+    'eating': 'Yeme',
+    'walking': 'Yürüme',
+    'resting': 'Dinlenme',
+    'drinking': 'Su İçme',
+    'running': 'Koşma',
+    'standing': 'Ayakta Durma',
+    'lying': 'Yatma',
+    'grazing': 'Otlama'
+}
+
+# Pasta grafiği renk paleti
+_PIE_COLORS = (
+    '#3498db', '#e74c3c', '#2ecc71', '#f39c12',
+    '#9b59b6', '#1abc9c', '#34495e', '#e67e22'
+)
+
+# Uyarıları zamana göre sıralama anahtarı
+_BY_TIMESTAMP = attrgetter('timestamp')
+
+# Saatlik grafik etiketleri (00:00 ... 23:00)
+_HOURS = range(24)
+_HOUR_LABELS = tuple(f"{i:02d}:00" for i in _HOURS)
+_NO_ACTIVITY = (0,) * 24
+
+# Haftalık trend için bugünden geriye gün farkları (6 ... 0)
+_WEEK_OFFSETS = np.arange(6, -1, -1, dtype='timedelta64[D]')
+
+
+@lru_cache(maxsize=1)
+def _week_days(today: date) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Son 7 günün veri anahtarları (YYYY-MM-DD) ve etiketleri (MM-DD); gün başına bir kez hesaplanır"""
+    days = np.datetime64(today, 'D') - _WEEK_OFFSETS
+    keys = tuple(np.datetime_as_string(days, unit='D').tolist())
+    return keys, tuple(key[5:] for key in keys)
+
+
+def _hourly_values(hourly_data: Union[Dict[int, int], Sequence[int]]) -> Tuple[int, ...]:
+    """Saatlik veriyi 24 elemanlı değer dizisine çevir"""
+    if isinstance(hourly_data, dict):
+        return tuple(map(hourly_data.get, _HOURS, _NO_ACTIVITY))
+    values = tuple(hourly_data[:24])
+    return values + _NO_ACTIVITY[len(values):]
+
+
+def _behavior_series(behavior_counts: Dict[str, int]) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """Davranış sayılarından Türkçe etiket ve değer dizileri"""
+    # Bilinmeyen davranışlar kendi adıyla etiketlenir
+    labels = tuple(map(_BEHAVIOR_LABELS_TR.get, behavior_counts, behavior_counts))
+    return labels, tuple(behavior_counts.values())
+
 
 class WidgetType(Enum):
     """Dashboard widget türleri"""
@@ -22,7 +92,7 @@ class WidgetType(Enum):
     HEATMAP = "heatmap"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StatCard:
     """İstatistik kartı verisi"""
     title: str
@@ -34,27 +104,38 @@ class StatCard:
     color: str = "blue"
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'title': self.title,
+            'value': self.value,
+            'unit': self.unit,
+            'change': self.change,
+            'change_period': self.change_period,
+            'icon': self.icon,
+            'color': self.color
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChartData:
     """Grafik verisi"""
     title: str
     chart_type: str
     labels: List[str]
     datasets: List[Dict[str, Any]]
-    options: Dict[str, Any] = None
+    options: Dict[str, Any] = field(default_factory=dict)
     
-    def __post_init__(self):
-        if self.options is None:
-            self.options = {}
-            
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # labels/datasets/options kopyalanmaz, bu ChartData örneğiyle paylaşılır
+        return {
+            'title': self.title,
+            'chart_type': self.chart_type,
+            'labels': self.labels,
+            'datasets': self.datasets,
+            'options': self.options
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertItem:
     """Uyarı öğesi"""
     id: str
@@ -66,9 +147,15 @@ class AlertItem:
     is_read: bool = False
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            'id': self.id,
+            'title': self.title,
+            'message': self.message,
+            'severity': self.severity,
+            'timestamp': self.timestamp.isoformat(),
+            'animal_id': self.animal_id,
+            'is_read': self.is_read
+        }
 
 
 class DashboardDataProvider:
@@ -129,21 +216,26 @@ class DashboardDataProvider:
         
         return stats
         
-    def get_activity_chart(self, hourly_data: Dict[int, int] = None) -> ChartData:
-        """Saatlik aktivite grafiği"""
+    def get_activity_chart(
+        self,
+        hourly_data: Union[Dict[int, int], Sequence[int]] = None
+    ) -> ChartData:
+        """Saatlik aktivite grafiği
+        
+        hourly_data saat -> sayı sözlüğü ya da saat sırasıyla (0-23) dizi olabilir.
+        """
         if hourly_data is None:
-            hourly_data = {i: 0 for i in range(24)}
+            hourly_data = _NO_ACTIVITY
             
-        labels = [f"{i:02d}:00" for i in range(24)]
-        values = [hourly_data.get(i, 0) for i in range(24)]
+        values = _hourly_values(hourly_data)
         
         return ChartData(
             title="Saatlik Aktivite",
             chart_type="line",
-            labels=labels,
+            labels=list(_HOUR_LABELS),
             datasets=[{
                 'label': 'Tespit Sayısı',
-                'data': values,
+                'data': list(values),
                 'borderColor': '#3498db',
                 'backgroundColor': 'rgba(52, 152, 219, 0.1)',
                 'fill': True
@@ -161,33 +253,15 @@ class DashboardDataProvider:
         if behavior_counts is None:
             behavior_counts = {}
             
-        # Türkçe davranış etiketleri
-        behavior_labels = {
-            'eating': 'Yeme',
-            'walking': 'Yürüme',
-            'resting': 'Dinlenme',
-            'drinking': 'Su İçme',
-            'running': 'Koşma',
-            'standing': 'Ayakta Durma',
-            'lying': 'Yatma',
-            'grazing': 'Otlama'
-        }
-        
-        labels = [behavior_labels.get(k, k) for k in behavior_counts.keys()]
-        values = list(behavior_counts.values())
-        
-        colors = [
-            '#3498db', '#e74c3c', '#2ecc71', '#f39c12',
-            '#9b59b6', '#1abc9c', '#34495e', '#e67e22'
-        ]
+        labels, values = _behavior_series(behavior_counts)
         
         return ChartData(
             title="Davranış Dağılımı",
             chart_type="pie",
-            labels=labels,
+            labels=list(labels),
             datasets=[{
-                'data': values,
-                'backgroundColor': colors[:len(values)]
+                'data': list(values),
+                'backgroundColor': list(_PIE_COLORS[:len(values)])
             }]
         )
         
@@ -196,35 +270,24 @@ class DashboardDataProvider:
         if health_data is None:
             health_data = []
             
-        # Sağlık skorlarını kategorilere ayır
-        categories = {
-            'Mükemmel (90-100)': 0,
-            'İyi (70-89)': 0,
-            'Orta (50-69)': 0,
-            'Dikkat (30-49)': 0,
-            'Kritik (0-29)': 0
-        }
-        
-        for animal in health_data:
-            score = animal.get('health_score', 0)
-            if score >= 90:
-                categories['Mükemmel (90-100)'] += 1
-            elif score >= 70:
-                categories['İyi (70-89)'] += 1
-            elif score >= 50:
-                categories['Orta (50-69)'] += 1
-            elif score >= 30:
-                categories['Dikkat (30-49)'] += 1
-            else:
-                categories['Kritik (0-29)'] += 1
+        # Sağlık skorlarını kategorilere ayır (digitize: 0=Kritik ... 4=Mükemmel)
+        if health_data:
+            scores = np.fromiter(
+                (animal.get('health_score', 0) for animal in health_data),
+                dtype=np.float64,
+                count=len(health_data)
+            )
+            counts = np.bincount(np.digitize(scores, _HEALTH_BINS), minlength=5)[::-1].tolist()
+        else:
+            counts = [0] * 5
                 
         return ChartData(
             title="Sağlık Durumu Dağılımı",
             chart_type="bar",
-            labels=list(categories.keys()),
+            labels=list(_HEALTH_CATEGORIES),
             datasets=[{
                 'label': 'Hayvan Sayısı',
-                'data': list(categories.values()),
+                'data': counts,
                 'backgroundColor': ['#27ae60', '#2ecc71', '#f1c40f', '#e67e22', '#e74c3c']
             }]
         )
@@ -235,17 +298,13 @@ class DashboardDataProvider:
             daily_data = {}
             
         # Son 7 gün
-        dates = []
-        values = []
-        for i in range(6, -1, -1):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            dates.append(date[-5:])  # MM-DD formatı
-            values.append(daily_data.get(date, 0))
+        keys, dates = _week_days(date.today())
+        values = [daily_data.get(key, 0) for key in keys]
             
         return ChartData(
             title="Haftalık Tespit Trendi",
             chart_type="line",
-            labels=dates,
+            labels=list(dates),
             datasets=[{
                 'label': 'Günlük Tespit',
                 'data': values,
@@ -293,8 +352,8 @@ class DashboardDataProvider:
         if alerts is None:
             return []
             
-        sorted_alerts = sorted(alerts, key=lambda x: x.timestamp, reverse=True)
-        return [alert.to_dict() for alert in sorted_alerts[:limit]]
+        # sorted(..., reverse=True)[:limit] ile aynı sıra, O(N log limit)
+        return [alert.to_dict() for alert in heapq.nlargest(limit, alerts, key=_BY_TIMESTAMP)]
         
     def get_camera_status(self, cameras: List[Dict] = None) -> List[Dict]:
         """Kamera durumlarını getir"""
@@ -7,7 +7,84 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 import json
+import math
 import os
+import time
+from string import Template
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# HTML rapor şablonunun sabit parçaları
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Hayvan Takip Raporu</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        h1 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        h2 { color: #34495e; margin-top: 30px; }
+        .metadata { background: #ecf0f1; padding: 15px; border-radius: 4px; margin-bottom: 20px; }
+        table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #3498db; color: white; }
+        tr:hover { background: #f5f5f5; }
+        .summary-card { display: inline-block; background: #3498db; color: white; padding: 20px; margin: 10px; border-radius: 8px; min-width: 150px; text-align: center; }
+        .summary-card h3 { margin: 0; font-size: 24px; }
+        .summary-card p { margin: 5px 0 0 0; opacity: 0.9; }
+        .alert { padding: 10px; margin: 5px 0; border-radius: 4px; }
+        .alert-warning { background: #f39c12; color: white; }
+        .alert-danger { background: #e74c3c; color: white; }
+        .alert-info { background: #3498db; color: white; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🐄 Hayvan Takip Sistemi Raporu</h1>
+"""
+
+_HTML_METADATA = Template("""        <div class="metadata">
+            <strong>Rapor Türü:</strong> $report_type | 
+            <strong>Oluşturulma:</strong> $generated_at
+        </div>
+""")
+
+_HTML_TAIL = """
+    </div>
+</body>
+</html>
+"""
+
+# CSV yazımında kullanılan dosya tamponu (sistem çağrısı sayısını azaltır)
+CSV_BUFFER_SIZE = 1 << 20
+
+
+def _row_values(row: Any) -> List[Any]:
+    """Tablo satırını CSV hücre listesine çevir (liste veya sözlük)"""
+    return row if isinstance(row, list) else list(row.values())
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Veride NaN/inf float olup olmadığı (orjson bunları null yazar)"""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
 
 
 class ReportType(Enum):
@@ -260,6 +337,24 @@ class ReportGenerator:
         filename = self._generate_filename(config, 'json')
         filepath = os.path.join(self.output_dir, filename)
         
+        if ORJSON_AVAILABLE and not _has_non_finite(report_data):
+            # orjson çıktısı okunduğunda json.dump(ensure_ascii=False, indent=2)
+            # ile aynı veriyi verir, ancak metin birebir aynı değildir:
+            # float'lar farklı biçimlenir (1e-05 -> 0.00001, 1e+16 -> 1e16).
+            # NaN/inf orjson'da null olacağından bu durumda json kullanılır.
+            # Saatlik aktivite gibi int anahtarlar json'daki gibi metne çevrilir
+            try:
+                data = orjson.dumps(
+                    report_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                data = None
+            if data is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                return filepath
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(report_data, f, ensure_ascii=False, indent=2)
             
@@ -272,7 +367,7 @@ class ReportGenerator:
         
         import csv
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Metadata
@@ -285,8 +380,7 @@ class ReportGenerator:
                 writer.writerow([section['title']])
                 if section['type'] == 'table' and 'columns' in section:
                     writer.writerow(section['columns'])
-                    for row in section.get('content', []):
-                        writer.writerow(row if isinstance(row, list) else list(row.values()))
+                    writer.writerows(map(_row_values, section.get('content', [])))
                 writer.writerow([])
                 
         return filepath
@@ -305,86 +399,46 @@ class ReportGenerator:
         
     def _build_html_template(self, report_data: Dict) -> str:
         """HTML şablonu oluştur"""
-        html = """
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Hayvan Takip Raporu</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        h1 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
-        h2 { color: #34495e; margin-top: 30px; }
-        .metadata { background: #ecf0f1; padding: 15px; border-radius: 4px; margin-bottom: 20px; }
-        table { width: 100%; border-collapse: collapse; margin: 15px 0; }
-        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
-        th { background: #3498db; color: white; }
-        tr:hover { background: #f5f5f5; }
-        .summary-card { display: inline-block; background: #3498db; color: white; padding: 20px; margin: 10px; border-radius: 8px; min-width: 150px; text-align: center; }
-        .summary-card h3 { margin: 0; font-size: 24px; }
-        .summary-card p { margin: 5px 0 0 0; opacity: 0.9; }
-        .alert { padding: 10px; margin: 5px 0; border-radius: 4px; }
-        .alert-warning { background: #f39c12; color: white; }
-        .alert-danger { background: #e74c3c; color: white; }
-        .alert-info { background: #3498db; color: white; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🐄 Hayvan Takip Sistemi Raporu</h1>
-        <div class="metadata">
-            <strong>Rapor Türü:</strong> {report_type} | 
-            <strong>Oluşturulma:</strong> {generated_at}
-        </div>
-""".format(
+        parts = [_HTML_HEAD, _HTML_METADATA.substitute(
             report_type=report_data['metadata']['report_type'],
             generated_at=report_data['metadata']['generated_at']
-        )
+        )]
         
         # Bölümleri ekle
         for section in report_data['sections']:
-            html += f"<h2>{section['title']}</h2>"
+            parts.append(f"<h2>{section['title']}</h2>")
             
             if section['type'] == 'summary':
-                html += '<div class="summary-cards">'
-                for key, value in section['content'].items():
-                    html += f'<div class="summary-card"><h3>{value}</h3><p>{key}</p></div>'
-                html += '</div>'
+                parts.append('<div class="summary-cards">')
+                parts.extend(
+                    f'<div class="summary-card"><h3>{value}</h3><p>{key}</p></div>'
+                    for key, value in section['content'].items()
+                )
+                parts.append('</div>')
                 
             elif section['type'] == 'table':
-                html += '<table><thead><tr>'
-                for col in section.get('columns', []):
-                    html += f'<th>{col}</th>'
-                html += '</tr></thead><tbody>'
+                parts.append('<table><thead><tr>')
+                parts.extend(f'<th>{col}</th>' for col in section.get('columns', []))
+                parts.append('</tr></thead><tbody>')
                 for row in section.get('content', []):
-                    html += '<tr>'
-                    if isinstance(row, list):
-                        for cell in row:
-                            html += f'<td>{cell}</td>'
-                    elif isinstance(row, dict):
-                        for cell in row.values():
-                            html += f'<td>{cell}</td>'
-                    html += '</tr>'
-                html += '</tbody></table>'
+                    if isinstance(row, dict):
+                        row = row.values()
+                    elif not isinstance(row, list):
+                        row = ()
+                    parts.append('<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>')
+                parts.append('</tbody></table>')
                 
             elif section['type'] == 'list':
-                html += '<ul>'
-                for item in section.get('content', []):
-                    html += f'<li>{item}</li>'
-                html += '</ul>'
+                parts.append('<ul>')
+                parts.extend(f'<li>{item}</li>' for item in section.get('content', []))
+                parts.append('</ul>')
                 
-        html += """
-    </div>
-</body>
-</html>
-"""
-        return html
+        parts.append(_HTML_TAIL)
+        return ''.join(parts)
         
     def _generate_filename(self, config: ReportConfig, extension: str) -> str:
         """Dosya adı oluştur"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         return f"report_{config.report_type.value}_{timestamp}.{extension}"
         
     def generate_daily_report(self, data: Dict[str, Any], format: ReportFormat = ReportFormat.HTML) -> str:
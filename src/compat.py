@@ -0,0 +1,14 @@
+"""
+AI Animal Tracking System - Python Sürüm Uyumluluğu
+===================================================
+
+Python sürümüne bağlı küçük yardımcılar. Paket içindeki her modül
+tarafından içe aktarılabilir; ağır bağımlılık yüklemez.
+"""
+
+import sys
+
+# Python 3.10+ üzerinde dataclass'lar __slots__ ile üretilir (örnek başına
+# __dict__ yok); 3.9'da normal dataclass olarak kalır.
+# Kullanım: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -25,6 +25,8 @@ except ImportError:
     Results = None
 
 
+from src.compat import DATACLASS_SLOTS
+
 logger = logging.getLogger("animal_tracking.detection")
 
 
@@ -104,7 +106,7 @@ class DetectorConfig:
     animal_classes: List[int] = field(default_factory=lambda: list(COCO_ANIMAL_CLASSES.keys()))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Detection:
     """Tek bir tespit sonucu"""
     class_id: int
@@ -11,11 +11,51 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson'un json.dump(default=str) ile aynı yazdığı tipler
+_PLAIN_SCALARS = frozenset((str, int, bool, type(None), datetime))
+_PLAIN_KEYS = frozenset((str, int))
+
+
+def _is_plain(data: Any) -> bool:
+    """
+    Verinin orjson ile json.dump ile aynı biçimde yazılıp yazılamayacağı.
+    
+    Yalnızca tam tipler kabul edilir: alt sınıflar (NumPy skalerleri,
+    Enum'lar) iki kütüphanede farklı yazılır. Float'lar yalnızca iki
+    kütüphanenin de sabit noktalı yazdığı aralıkta kabul edilir; NaN/inf
+    orjson'da null, 1e-05 ise 0.00001 olur.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind in _PLAIN_SCALARS:
+            continue
+        if kind is float:
+            if item != 0.0 and not 1e-4 <= abs(item) < 1e16:
+                return False
+        elif kind is dict:
+            if not all(type(key) in _PLAIN_KEYS for key in item):
+                return False
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        else:
+            return False
+    return True
+
 
 class BaseExporter(ABC):
     """Temel exporter sınıfı."""
@@ -102,20 +142,28 @@ class CSVExporter(BaseExporter):
         if columns is None:
             columns = list(data[0].keys())
         
-        # CSV yaz
+        # CSV yaz: satırlar DictWriter yerine itemgetter ile sütun sırasına
+        # dizilir; eksik sütunu olan veride DictWriter gibi boş bırakılır
+        rows = self._rows(data, columns)
         with open(filepath, "w", newline="", encoding=self.encoding) as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=columns,
-                delimiter=self.delimiter,
-                extrasaction="ignore"
-            )
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f, delimiter=self.delimiter)
+            writer.writerow(columns)
+            writer.writerows(rows)
         
         logger.info(f"Exported {len(data)} records to {filepath}")
         return filepath
     
+    @staticmethod
+    def _rows(data: List[Dict], columns: List[str]) -> List:
+        """Dict satırlarını sütun sırasındaki değer dizilerine çevir."""
+        if len(columns) > 1:
+            getter = itemgetter(*columns)
+            try:
+                return list(map(getter, data))
+            except KeyError:
+                pass
+        return [[row.get(column, "") for column in columns] for row in data]
+    
     def export_detections(
         self,
         detections: List[Dict],
@@ -188,14 +236,45 @@ class JSONExporter(BaseExporter):
         filepath = self.output_dir / full_filename
         
         # JSON yaz
-        with open(filepath, "w", encoding=self.encoding) as f:
-            indent = self.indent if pretty else None
-            json.dump(data, f, indent=indent, default=str, ensure_ascii=False)
+        indent = self.indent if pretty else None
+        payload = self._dumps_fast(data, indent)
+        if payload is not None:
+            filepath.write_bytes(payload)
+        else:
+            with open(filepath, "w", encoding=self.encoding) as f:
+                json.dump(data, f, indent=indent, default=str, ensure_ascii=False)
         
         record_count = len(data) if isinstance(data, list) else 1
         logger.info(f"Exported {record_count} records to {filepath}")
         return filepath
     
+    def _dumps_fast(self, data: Any, indent: Optional[int]) -> Optional[bytes]:
+        """
+        orjson ile serileştir (json.dump ile aynı çıktı).
+        
+        orjson yalnızca UTF-8 ve 2 boşluk girintiyi destekler (sıkışık
+        çıktısı json'un ayırıcılarından farklıdır); datetime'lar json'daki
+        gibi str() ile yazılır. Veri düz tiplerden oluşmuyorsa (bkz.
+        _is_plain) ya da desteklenmeyen durumlarda None döner ve standart
+        json kullanılır.
+        """
+        if not ORJSON_AVAILABLE or indent != 2:
+            return None
+        if self.encoding.lower().replace("-", "") != "utf8":
+            return None
+        if not _is_plain(data):
+            return None
+        
+        option = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except (TypeError, orjson.JSONEncodeError):
+            return None
+    
     def export_session_report(
         self,
         report: Dict,
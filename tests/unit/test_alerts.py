@@ -0,0 +1,342 @@
+"""
+Alert modülü unit testleri.
+"""
+
+
+def _make_alert(alert_id, **kwargs):
+    """Test için AlertNotification oluştur."""
+    from src.alerts import AlertNotification, AlertType, AlertSeverity
+    
+    params = dict(
+        id=alert_id,
+        rule_id="test_rule",
+        alert_type=AlertType.HEALTH_WARNING,
+        severity=AlertSeverity.WARNING,
+        title="Test",
+        message="Test alert",
+    )
+    params.update(kwargs)
+    return AlertNotification(**params)
+
+
+class TestAlertHistory:
+    """AlertHistory testleri."""
+    
+    def test_get_acknowledge_resolve(self):
+        """ID ile erişim, onaylama ve çözme testi."""
+        from src.alerts import AlertHistory
+        
+        history = AlertHistory()
+        history.add(_make_alert("a1"))
+        
+        assert history.get("a1").id == "a1"
+        assert history.get("missing") is None
+        
+        assert history.acknowledge("a1", acknowledged_by="vet")
+        assert history.get("a1").acknowledged_by == "vet"
+        assert history.get_unacknowledged() == []
+        
+        assert history.resolve("a1")
+        assert history.get_unresolved() == []
+        
+        assert not history.acknowledge("missing")
+        assert not history.resolve("missing")
+    
+    def test_eviction_updates_index(self):
+        """Dolu geçmişten düşen alarmların indekslerden silinmesi testi."""
+        from src.alerts import AlertHistory
+        
+        history = AlertHistory(max_size=3)
+        for i in range(5):
+            history.add(_make_alert(f"a{i}"))
+        
+        assert [a.id for a in history.get_recent()] == ["a2", "a3", "a4"]
+        assert history.get("a0") is None
+        assert history.get("a1") is None
+        assert not history.acknowledge("a0")
+        assert {a.id for a in history.get_unacknowledged()} == {"a2", "a3", "a4"}
+        assert history.get_statistics()["unresolved"] == 3
+    
+    def test_index_lookups_follow_eviction(self):
+        """Tür/kamera/hayvan indekslerinin geçmişle senkron kalması testi."""
+        from src.alerts import AlertHistory, AlertType, AlertSeverity
+        
+        history = AlertHistory(max_size=4)
+        for i in range(6):
+            history.add(_make_alert(
+                f"a{i}",
+                alert_type=AlertType.ZONE_ENTRY if i % 2 else AlertType.ZONE_EXIT,
+                camera_id=f"cam{i % 3}",
+                animal_id="cow_1",
+            ))
+        
+        assert [a.id for a in history.get_by_type(AlertType.ZONE_ENTRY)] == ["a3", "a5"]
+        assert [a.id for a in history.get_by_severity(AlertSeverity.WARNING)] == ["a2", "a3", "a4", "a5"]
+        assert [a.id for a in history.get_by_camera("cam0")] == ["a3"]
+        assert [a.id for a in history.get_by_animal("cow_1")] == ["a2", "a3", "a4", "a5"]
+        assert history.get_by_type(AlertType.CUSTOM) == []
+        
+        stats = history.get_statistics()
+        assert stats["by_type"] == {"zone_exit": 2, "zone_entry": 2}
+    
+    def test_serialized_payload_cached_until_changed(self):
+        """JSON çıktısının önbelleklenmesi ve değişince yenilenmesi testi."""
+        import json
+        from src.alerts import AlertHistory
+        
+        history = AlertHistory()
+        alert = _make_alert("a1")
+        history.add(alert)
+        
+        payload = alert.to_json_bytes()
+        assert alert.to_json_bytes() is payload
+        assert json.loads(payload) == json.loads(json.dumps(alert.to_dict()))
+        
+        history.acknowledge("a1")
+        assert json.loads(alert.to_json_bytes())["acknowledged"] is True
+    
+    def test_pending_lists_keep_history_order(self):
+        """Onaylanmamış/çözülmemiş listelerinin sırasını koruması testi."""
+        from src.alerts import AlertHistory
+        
+        history = AlertHistory()
+        for i in range(5):
+            history.add(_make_alert(f"a{i}"))
+        history.acknowledge("a1")
+        history.resolve("a3")
+        
+        assert [a.id for a in history.get_unacknowledged()] == ["a0", "a2", "a3", "a4"]
+        assert [a.id for a in history.get_unresolved()] == ["a0", "a1", "a2", "a4"]
+
+
+class TestAlertManager:
+    """AlertManager testleri."""
+    
+    def test_duplicate_alerts_collapse(self):
+        """Pencere içindeki aynı alarmların tek alarmda toplanması testi."""
+        from src.alerts import AlertManager, AlertRule, AlertType, AlertSeverity
+        
+        manager = AlertManager()
+        manager.add_rule(AlertRule(
+            id="zone",
+            name="Zone",
+            alert_type=AlertType.ZONE_ENTRY,
+            severity=AlertSeverity.INFO,
+            cooldown_seconds=0,
+            dedup_seconds=60
+        ))
+        
+        first = manager.trigger("zone", "Zone", "Entered A", animal_id="cow_1")
+        second = manager.trigger("zone", "Zone", "Entered A", animal_id="cow_1")
+        other = manager.trigger("zone", "Zone", "Entered A", animal_id="cow_2")
+        
+        assert second is first
+        assert first.details["dedup_count"] == 2
+        assert other is not first
+        assert len(manager.get_recent_alerts()) == 2
+        assert manager.get_rule("zone").trigger_count == 2
+        
+        assert manager.cleanup_expired_state() == 0
+    
+    def test_background_dispatch(self):
+        """Bildirimlerin arka plan thread'inde gönderilmesi testi."""
+        import threading
+        from src.alerts import AlertManager
+        
+        manager = AlertManager()
+        delivered = []
+        done = threading.Event()
+        
+        def callback(alert):
+            delivered.append((alert.id, threading.current_thread().name))
+            done.set()
+        
+        manager.add_callback(callback)
+        manager.start()
+        try:
+            alert = manager.trigger_camera_offline("cam1")
+            assert done.wait(timeout=2)
+        finally:
+            manager.stop()
+        
+        assert delivered == [(alert.id, "AlertDispatcher")]
+    
+    def test_cooldown_blocks_retrigger(self):
+        """Bekleme süresi içinde kuralın tekrar tetiklenmemesi testi."""
+        from src.alerts import AlertManager
+        
+        manager = AlertManager()
+        first = manager.trigger_camera_offline("cam1")
+        
+        assert first is not None
+        assert manager.trigger_camera_offline("cam1") is None
+        assert manager.get_rule("camera_offline").last_triggered == first.timestamp
+        
+        manager._rule_last_triggered["camera_offline"] -= 301
+        assert manager.trigger_camera_offline("cam1") is not None
+    
+    def test_trigger_by_type_uses_first_enabled_rule(self):
+        """Türe göre tetiklemede ilk etkin kuralın kullanılması testi."""
+        from src.alerts import AlertManager, AlertRule, AlertType, AlertSeverity
+        
+        manager = AlertManager()
+        for rule_id in ("zone_a", "zone_b"):
+            manager.add_rule(AlertRule(
+                id=rule_id,
+                name=rule_id,
+                alert_type=AlertType.ZONE_EXIT,
+                severity=AlertSeverity.INFO
+            ))
+        manager.disable_rule("zone_a")
+        
+        alert = manager.trigger_by_type(AlertType.ZONE_EXIT, "Exit", "Left pen")
+        assert alert.rule_id == "zone_b"
+        
+        manager.remove_rule("zone_b")
+        alert = manager.trigger_by_type(AlertType.ZONE_EXIT, "Exit", "Left pen")
+        assert alert.rule_id == "ad_hoc"
+    
+    def test_channel_added_after_rule(self):
+        """Kuraldan sonra eklenen kanalın kurala bağlanması testi."""
+        from src.alerts import AlertManager, AlertRule, AlertType, AlertSeverity
+        from src.alerts.alert_manager import CallbackNotificationChannel
+        
+        manager = AlertManager()
+        manager.add_rule(AlertRule(
+            id="count",
+            name="Count",
+            alert_type=AlertType.COUNT_LOW,
+            severity=AlertSeverity.WARNING,
+            notification_channels=["log", "sms"]
+        ))
+        received = []
+        manager.add_channel("sms", CallbackNotificationChannel(received.append))
+        
+        alert = manager.trigger("count", "Count low", "3 animals missing")
+        assert received == [alert]
+    
+    def test_trigger_bulk_matches_sequential_triggers(self):
+        """Toplu tetiklemenin ardışık tetiklemelerle aynı sonucu vermesi testi."""
+        from src.alerts import AlertManager, AlertRule, AlertType, AlertSeverity
+        from src.alerts.alert_manager import NotificationChannel
+        
+        class BatchRecorder(NotificationChannel):
+            def __init__(self):
+                self.batches = []
+        
+            def send(self, alert):
+                self.batches.append([alert])
+                return True
+        
+            def send_batch(self, alerts):
+                self.batches.append(list(alerts))
+                return True
+        
+        manager = AlertManager()
+        manager.add_rule(AlertRule(
+            id="herd",
+            name="Herd",
+            alert_type=AlertType.HEALTH_WARNING,
+            severity=AlertSeverity.WARNING,
+            cooldown_seconds=0,
+            notification_channels=["batch"]
+        ))
+        recorder = BatchRecorder()
+        manager.add_channel("batch", recorder)
+        
+        results = manager.trigger_bulk([
+            {'rule_id': "herd", 'title': "Low", 'message': "a1", 'animal_id': "a1"},
+            {'rule_id': "missing", 'title': "Low", 'message': "a2"},
+            {'rule_id': "herd", 'title': "Low", 'message': "a3", 'animal_id': "a3"},
+        ])
+        
+        assert results[1] is None
+        assert [a.animal_id for a in recorder.batches[0]] == ["a1", "a3"]
+        assert results[0] is recorder.batches[0][0]
+        assert len(recorder.batches) == 1
+        assert manager.history.get(results[2].id) is results[2]
+        assert manager.get_rule("herd").trigger_count == 2
+        
+        # Varsayılan kural bekleme süresi toplu çağrıda da uygulanır
+        alerts = manager.check_health_batch({"c1": 10.0, "c2": 20.0, "w1": 50.0, "ok": 90.0})
+        assert set(alerts) == {"c1", "w1"}
+    
+    def test_config_round_trip_keeps_severity_labels(self):
+        """Konfigürasyon dışa/içe aktarımında önem etiketlerinin korunması testi."""
+        from src.alerts import AlertManager, AlertSeverity
+        
+        config = AlertManager().export_config()
+        severities = {r["id"]: r["severity"] for r in config["rules"]}
+        assert severities["health_critical"] == "critical"
+        
+        manager = AlertManager()
+        manager.import_config(config)
+        assert manager.get_rule("health_critical").severity is AlertSeverity.CRITICAL
+        assert AlertSeverity("warning") is AlertSeverity.WARNING
+        assert AlertSeverity.WARNING < AlertSeverity.CRITICAL
+
+
+class TestWebhookNotificationChannel:
+    """WebhookNotificationChannel testleri."""
+    
+    def test_batch_window_coalesces_alerts(self, monkeypatch):
+        """Pencere içindeki alarmların tek POST'ta gönderilmesi testi."""
+        import json
+        from src.alerts.alert_manager import WebhookNotificationChannel
+        
+        channel = WebhookNotificationChannel("http://localhost/hook", batch_window=60)
+        posted = []
+        monkeypatch.setattr(channel, "_post", lambda data: posted.append(json.loads(data)) or True)
+        
+        for i in range(3):
+            assert channel.send(_make_alert(f"a{i}"))
+        assert posted == []
+        
+        assert channel.flush()
+        assert len(posted) == 1
+        assert [a["id"] for a in posted[0]] == ["a0", "a1", "a2"]
+        
+        assert channel.flush()
+        assert len(posted) == 1
+    
+    def test_send_batch_without_window_posts_each_alert(self, monkeypatch):
+        """Pencere kapalıyken toplu gönderimde her alarmın ayrı POST edilmesi testi."""
+        import json
+        from src.alerts.alert_manager import WebhookNotificationChannel
+        
+        channel = WebhookNotificationChannel("http://localhost/hook")
+        posted = []
+        monkeypatch.setattr(channel, "_post", lambda data: posted.append(json.loads(data)) or True)
+        
+        assert channel.send_batch([_make_alert("a0"), _make_alert("a1")])
+        assert [p["id"] for p in posted] == ["a0", "a1"]
+        
+        batching = WebhookNotificationChannel("http://localhost/hook", batch_window=60)
+        monkeypatch.setattr(batching, "_post", lambda data: posted.append(json.loads(data)) or True)
+        
+        assert batching.send_batch([_make_alert("b0"), _make_alert("b1")])
+        assert batching.flush()
+        assert [a["id"] for a in posted[-1]] == ["b0", "b1"]
+
+
+class TestAlertRule:
+    """AlertRule testleri."""
+    
+    def test_schedule_parsed_once(self):
+        """Zaman çizelgesinin kural eklenirken ayrıştırılması testi."""
+        from datetime import time
+        from src.alerts import AlertManager, AlertRule, AlertType, AlertSeverity
+        
+        rule = AlertRule(
+            id="night",
+            name="Night",
+            alert_type=AlertType.INACTIVITY,
+            severity=AlertSeverity.INFO,
+            schedule_start="22:00",
+            schedule_end="06:00"
+        )
+        assert (rule._start_time, rule._end_time) == (time(22, 0), time(6, 0))
+        
+        rule.schedule_start = None
+        AlertManager().add_rule(rule)
+        assert rule._start_time is None
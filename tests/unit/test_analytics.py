@@ -0,0 +1,204 @@
+"""
+Analytics modülü unit testleri.
+"""
+
+from datetime import datetime
+
+
+class TestDashboardData:
+    """Dashboard veri sınıfları testleri."""
+
+    def test_to_dict_matches_fields(self):
+        """to_dict çıktısının dataclass alanlarıyla aynı olması testi."""
+        from dataclasses import fields
+        from src.analytics import StatCard, ChartData, AlertItem
+
+        card = StatCard(title="Toplam", value=3, unit="adet")
+        chart = ChartData(title="Grafik", chart_type="bar", labels=["a"], datasets=[{'data': [1]}])
+        alert = AlertItem(
+            id="a1",
+            title="Uyarı",
+            message="Mesaj",
+            severity="warning",
+            timestamp=datetime(2024, 1, 2, 3, 4, 5)
+        )
+
+        for item in (card, chart, alert):
+            assert list(item.to_dict()) == [f.name for f in fields(item)]
+
+        assert card.to_dict()['unit'] == "adet"
+        assert chart.to_dict()['options'] == {}
+        assert alert.to_dict()['timestamp'] == "2024-01-02T03:04:05"
+
+    def test_health_overview_buckets(self):
+        """Sağlık skorlarının sınır değerlerde doğru kategorilere ayrılması testi."""
+        from src.analytics import DashboardDataProvider
+
+        provider = DashboardDataProvider()
+        scores = [95, 90, 89.5, 70, 69, 50, 49.9, 30, 29, 0]
+        chart = provider.get_health_overview([{'health_score': s} for s in scores] + [{}])
+
+        assert chart.labels[0] == 'Mükemmel (90-100)'
+        assert chart.datasets[0]['data'] == [2, 2, 2, 2, 3]
+        assert provider.get_health_overview().datasets[0]['data'] == [0, 0, 0, 0, 0]
+
+    def test_hourly_and_weekly_series(self):
+        """Saatlik ve haftalık serilerin doğru etiket/değerlerle üretilmesi testi."""
+        from datetime import date, timedelta
+        from src.analytics import DashboardDataProvider
+
+        provider = DashboardDataProvider()
+        activity = provider.get_activity_chart({0: 3, 23: 7})
+        assert activity.labels[0] == "00:00" and activity.labels[-1] == "23:00"
+        assert activity.datasets[0]['data'][0] == 3
+        assert activity.datasets[0]['data'][23] == 7
+        assert sum(activity.datasets[0]['data']) == 10
+        assert provider.get_activity_chart([1, 2]).datasets[0]['data'] == [1, 2] + [0] * 22
+        assert provider.get_activity_chart().datasets[0]['data'] == [0] * 24
+
+        yesterday = date.today() - timedelta(days=1)
+        weekly = provider.get_weekly_trend({yesterday.strftime("%Y-%m-%d"): 5})
+        assert weekly.labels[-2] == yesterday.strftime("%m-%d")
+        assert weekly.datasets[0]['data'] == [0, 0, 0, 0, 0, 5, 0]
+
+    def test_results_not_shared(self):
+        """Tekrarlanan çağrıların sonuçlarının çağıranlar arasında paylaşılmaması testi."""
+        from src.analytics import DashboardDataProvider
+
+        provider = DashboardDataProvider()
+        first = provider.get_activity_chart({1: 5}).to_dict()
+        first['datasets'][0]['data'].clear()
+        first['labels'].clear()
+
+        second = provider.get_activity_chart({1: 5})
+        assert second.datasets[0]['data'][1] == 5
+        assert len(second.labels) == 24
+        assert provider.get_activity_chart({1: 6}).datasets[0]['data'][1] == 6
+
+        chart = provider.get_behavior_distribution({'eating': 3})
+        chart.labels.append('x')
+        again = provider.get_behavior_distribution({'eating': 3})
+        assert again is not chart
+        assert again.labels == ['Yeme']
+
+        stats = provider.get_overview_stats({'total_animals': 5})
+        stats.clear()
+        assert provider.get_overview_stats({'total_animals': 5})[0].value == 5
+
+    def test_recent_alerts_newest_first(self):
+        """Son uyarıların en yeniden eskiye ve limitle dönmesi testi."""
+        from datetime import datetime, timedelta
+        from src.analytics import DashboardDataProvider, AlertItem
+
+        base = datetime(2024, 1, 1)
+        alerts = [
+            AlertItem(id=f"a{i}", title="t", message="m", severity="info",
+                      timestamp=base + timedelta(minutes=(i * 7) % 20))
+            for i in range(20)
+        ]
+        alerts.append(AlertItem(id="tie", title="t", message="m", severity="info",
+                                timestamp=base + timedelta(minutes=19)))
+
+        recent = DashboardDataProvider().get_recent_alerts(alerts, limit=3)
+        expected = sorted(alerts, key=lambda a: a.timestamp, reverse=True)[:3]
+        assert [a['id'] for a in recent] == [a.id for a in expected]
+        assert DashboardDataProvider().get_recent_alerts() == []
+
+    def test_behavior_distribution_labels(self):
+        """Davranış dağılımında Türkçe etiket ve renklerin sırayla verilmesi testi."""
+        from src.analytics import DashboardDataProvider
+
+        chart = DashboardDataProvider().get_behavior_distribution({'eating': 4, 'unknown': 1})
+
+        assert chart.labels == ['Yeme', 'unknown']
+        assert chart.datasets[0]['data'] == [4, 1]
+        assert chart.datasets[0]['backgroundColor'] == ['#3498db', '#e74c3c']
+
+        many = {f'b{i}': i for i in range(10)}
+        chart = DashboardDataProvider().get_behavior_distribution(many)
+        assert chart.datasets[0]['data'] == list(range(10))
+        assert len(chart.datasets[0]['backgroundColor']) == 8
+
+
+class TestReportGenerator:
+    """ReportGenerator testleri."""
+
+    def test_json_report_round_trip(self, tmp_path):
+        """JSON raporunun Türkçe metin ve int anahtarlarla okunabilmesi testi."""
+        import json
+        from src.analytics import ReportGenerator, ReportFormat
+
+        generator = ReportGenerator(output_dir=str(tmp_path))
+        path = generator.generate_daily_report(
+            {'hourly_activity': {8: 12, 9: 4}, 'daily_alerts': ['Sağlık uyarısı']},
+            format=ReportFormat.JSON
+        )
+
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        report = json.loads(text)
+
+        assert 'Sağlık uyarısı' in text
+        assert report['metadata']['report_type'] == 'daily'
+        sections = {s['title']: s for s in report['sections']}
+        assert sections['Saatlik Aktivite Dağılımı']['content'] == {'8': 12, '9': 4}
+
+    def test_json_report_keeps_non_finite_floats(self, tmp_path):
+        """NaN değerlerin JSON raporunda null'a dönüşmemesi testi."""
+        import json
+        import math
+        from src.analytics import ReportGenerator, ReportFormat
+
+        generator = ReportGenerator(output_dir=str(tmp_path))
+        path = generator.generate_daily_report(
+            {'hourly_activity': {8: float('nan')}},
+            format=ReportFormat.JSON
+        )
+
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+
+        sections = {s['title']: s for s in report['sections']}
+        assert math.isnan(sections['Saatlik Aktivite Dağılımı']['content']['8'])
+
+    def test_html_report_contains_sections(self, tmp_path):
+        """HTML raporunun metadata, tablo ve liste bölümlerini içermesi testi."""
+        from src.analytics import ReportGenerator
+
+        generator = ReportGenerator(output_dir=str(tmp_path))
+        path = generator.generate_daily_report({
+            'total_animals': 12,
+            'animal_summary': [['cow_1', 5, '2s', 'Yeme'], {'id': 'cow_2', 'count': 3}],
+            'daily_alerts': ['Sağlık uyarısı']
+        })
+
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+
+        assert html.lstrip().startswith('<!DOCTYPE html>')
+        assert '<strong>Rapor Türü:</strong> daily' in html
+        assert '<div class="summary-card"><h3>12</h3><p>total_animals</p></div>' in html
+        assert '<tr><td>cow_1</td><td>5</td><td>2s</td><td>Yeme</td></tr>' in html
+        assert '<tr><td>cow_2</td><td>3</td></tr>' in html
+        assert '<li>Sağlık uyarısı</li>' in html
+        assert html.rstrip().endswith('</html>')
+
+    def test_csv_report_rows(self, tmp_path):
+        """CSV raporunda liste ve sözlük satırlarının yazılması testi."""
+        import csv
+        from src.analytics import ReportGenerator, ReportFormat
+
+        generator = ReportGenerator(output_dir=str(tmp_path))
+        path = generator.generate_daily_report(
+            {'animal_summary': [['cow_1', 5, '2s', 'Yeme'], {'id': 'cow_2', 'count': 3}]},
+            format=ReportFormat.CSV
+        )
+
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ['Rapor Türü', 'daily']
+        start = rows.index(['Hayvan Aktivite Özeti'])
+        assert rows[start + 1] == ['Hayvan ID', 'Tespit Sayısı', 'Aktif Süre', 'Ana Davranış']
+        assert rows[start + 2] == ['cow_1', '5', '2s', 'Yeme']
+        assert rows[start + 3] == ['cow_2', '3']
@@ -83,6 +83,25 @@ class TestCSVExporter:
             
             assert "a" in content
             assert "c" in content
+    
+    def test_export_missing_column(self):
+        """Eksik sütunlu satır export testi."""
+        from src.export.exporters import CSVExporter
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = CSVExporter(output_dir=tmpdir)
+            
+            data = [
+                {"a": 1, "b": 2, "c": 3},
+                {"a": 4, "c": 6, "d": 7},
+            ]
+            
+            filepath = exporter.export(data, "test", timestamp=False)
+            
+            with open(filepath, newline="") as f:
+                content = f.read()
+            
+            assert content == "a,b,c\r\n1,2,3\r\n4,,6\r\n"
 
 
 class TestJSONExporter:
@@ -138,6 +157,52 @@ class TestJSONExporter:
                 loaded = json.load(f)
             
             assert len(loaded) == 2
+    
+    def test_export_matches_json_dump(self):
+        """Düz veride (dict/list/str/int/datetime) çıktının json.dump ile aynı olduğunu doğrula."""
+        from src.export.exporters import JSONExporter
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = JSONExporter(output_dir=tmpdir)
+            
+            data = [
+                {"id": 1, "time": datetime(2024, 1, 1, 12, 30), "name": "inek_ğ", "extra": None},
+                {"id": 2, "scores": {1: 0.5}},
+            ]
+            
+            filepath = exporter.export(data, "test", timestamp=False)
+            
+            with open(filepath, encoding="utf-8") as f:
+                content = f.read()
+            
+            assert content == json.dumps(data, indent=2, default=str, ensure_ascii=False)
+    
+    def test_export_non_plain_values_match_json_dump(self):
+        """NumPy skaleri, Enum ve uç float değerlerin json.dump gibi yazılması testi."""
+        from enum import Enum
+        import numpy as np
+        from src.export.exporters import JSONExporter
+        
+        class Color(Enum):
+            RED = 1
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = JSONExporter(output_dir=tmpdir)
+            
+            data = {
+                "score": np.float64(0.5),
+                "count": np.int64(3),
+                "color": Color.RED,
+                "small": 1e-05,
+                "missing": float("nan"),
+            }
+            
+            filepath = exporter.export(data, "test", timestamp=False)
+            
+            with open(filepath, encoding="utf-8") as f:
+                content = f.read()
+            
+            assert content == json.dumps(data, indent=2, default=str, ensure_ascii=False)
 
 
 class TestBaseExporter:
@@ -0,0 +1,124 @@
+"""
+HuggingFace Space uygulaması (huggingface/app.py) unit testleri.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("fastapi")
+
+import numpy as np
+
+
+@pytest.fixture(scope="module")
+def app():
+    """huggingface/app.py modülünü yükle."""
+    path = Path(__file__).resolve().parents[2] / "huggingface" / "app.py"
+    spec = importlib.util.spec_from_file_location("huggingface_app", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestFrameCache:
+    """AnimalDetector kare önbelleği testleri."""
+
+    def test_frames_registering_animals_not_cached(self, app, monkeypatch):
+        """Yeni hayvan kaydeden karelerin önbelleğe alınmaması testi."""
+        detector = app.AnimalDetector()
+        processed = []
+
+        def process_frame(image, results=None, start_time=None):
+            processed.append(image)
+            return {"frame_id": len(processed), "new_this_frame": int(len(processed) == 1)}
+
+        monkeypatch.setattr(detector, "detect", lambda images: [None] * len(images))
+        monkeypatch.setattr(detector, "process_frame", process_frame)
+
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        first = detector.process_batch([image], [b"key"])[0]
+        second = detector.process_batch([image], [b"key"])[0]
+        third = detector.process_batch([image], [b"key"])[0]
+
+        assert first["new_this_frame"] == 1
+        assert second["new_this_frame"] == 0
+        assert third["new_this_frame"] == 0
+        assert len(processed) == 2
+
+
+class TestAnimalGallery:
+    """AnimalGallery testleri."""
+
+    def test_recompute_ema_matches_live_updates(self, app):
+        """Geçmişten yeniden hesaplanan EMA'nın update() ile aynı olması testi."""
+        rng = np.random.default_rng(0)
+        gallery = app.AnimalGallery()
+        observations = rng.random((20, 192), dtype=np.float32)
+
+        animal_id = gallery.register(observations[0], "cow", 0.9, now=0.0)
+        for features in observations[1:]:
+            gallery.update(animal_id, features, 0.8, now=1.0)
+
+        rebuilt = gallery.recompute_ema(animal_id, gallery.alpha)
+        np.testing.assert_array_equal(rebuilt, gallery.get_features(animal_id))
+
+        assert gallery.retune(0.5) == 1
+        np.testing.assert_array_equal(
+            gallery.get_features(animal_id), gallery.recompute_ema(animal_id, 0.5)
+        )
+        assert not np.allclose(gallery.get_features(animal_id), rebuilt)
+
+
+def _reference_features(image, bbox, feature_size=(128, 256), color_bins=32):
+    """Kırp-yeniden boyutlandır-histogram-birleştir referans öznitelik çıkarımı."""
+    import cv2
+
+    x1, y1, x2, y2 = bbox
+    crop = cv2.resize(image[y1:y2, x1:x2], feature_size)
+    features = []
+
+    hsv = cv2.cvtColor(crop, cv2.COLOR_BGR2HSV)
+    for i, bins in enumerate([color_bins, color_bins, color_bins // 2]):
+        hist = cv2.calcHist([hsv], [i], None, [bins], [0, 256 if i > 0 else 180])
+        cv2.normalize(hist, hist)
+        features.append(hist.flatten())
+
+    h_crop = crop.shape[0]
+    for region in [crop[:h_crop // 3], crop[h_crop // 3:2 * h_crop // 3], crop[2 * h_crop // 3:]]:
+        hist = cv2.calcHist([cv2.cvtColor(region, cv2.COLOR_BGR2HSV)], [0], None, [color_bins], [0, 180])
+        cv2.normalize(hist, hist)
+        features.append(hist.flatten())
+
+    edges = cv2.Canny(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY), 50, 150)
+    edge_hist = cv2.calcHist([edges], [0], None, [16], [0, 256])
+    cv2.normalize(edge_hist, edge_hist)
+    features.append(edge_hist.flatten())
+
+    combined = np.concatenate(features)
+    return (combined / np.linalg.norm(combined)).astype(np.float32)
+
+
+class TestFeatureExtractor:
+    """FeatureExtractor testleri."""
+
+    def test_batch_features_match_reference_within_tolerance(self, app):
+        """Toplu çıkarımın referans ile birkaç float32 ulp içinde aynı olması testi.
+
+        Kenar histogramı cv2.normalize yerine float32 normla bölündüğünden
+        sonuçlar bit düzeyinde aynı değildir; fark ~6e-8 civarındadır.
+        """
+        import cv2
+
+        rng = np.random.default_rng(1)
+        extractor = app.FeatureExtractor(use_opencl=False, workers=1)
+        bboxes = [(10, 20, 200, 230), (50, 0, 320, 100), (0, 0, 37, 41)]
+
+        for sigma in (0.5, 2.0, 5.0):
+            image = rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+            image = cv2.GaussianBlur(image, (0, 0), sigma)
+
+            for bbox, features in zip(bboxes, extractor.extract_batch(image, bboxes)):
+                np.testing.assert_allclose(features, _reference_features(image, bbox), rtol=0, atol=2e-7)